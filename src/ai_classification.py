@@ -3,7 +3,7 @@ AI Classification Component for AI-Assisted Home Inspection Workspace
 Handles text and image classification using Snowflake Cortex AI
 """
 
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 import uuid
 from datetime import datetime
 
@@ -120,11 +120,9 @@ class AIClassification:
                 confidence_score = 0.0
             
             # Store the classification result
-            self._store_classification_result(
+            self._store_classification_results(
                 finding_id,
-                defect_tag,
-                confidence_score,
-                'text_ai'
+                [(defect_tag, confidence_score, 'text_ai')]
             )
             
             # Update finding status to processed
@@ -202,34 +200,68 @@ class AIClassification:
         Returns:
             tag_id: Unique identifier for the stored tag
         """
-        tag_id = str(uuid.uuid4())
-        history_id = str(uuid.uuid4())
+        return self._store_classification_results(
+            finding_id,
+            [(defect_category, confidence_score, classification_method)]
+        )[0]
+    
+    def _store_classification_results(
+        self,
+        finding_id: str,
+        results: List[Tuple[str, float, str]]
+    ) -> List[str]:
+        """
+        Store several classification results for one finding, using a single
+        multi-row INSERT for each of defect_tags and classification_history
+        
+        Args:
+            finding_id: ID of the finding being classified
+            results: List of (defect_category, confidence_score, classification_method)
+            
+        Returns:
+            List of tag_ids, in the same order as results
+        """
+        tag_ids = []
+        tag_params = []
+        history_params = []
         
-        # Get severity weight for this category
-        severity_weight = self.SEVERITY_WEIGHTS.get(defect_category, 0)
+        for defect_category, confidence_score, classification_method in results:
+            tag_id = str(uuid.uuid4())
+            tag_ids.append(tag_id)
+            
+            # Get severity weight for this category
+            severity_weight = self.SEVERITY_WEIGHTS.get(defect_category, 0)
+            
+            tag_params.extend((tag_id, finding_id, defect_category, confidence_score, severity_weight))
+            history_params.extend((
+                str(uuid.uuid4()), finding_id, defect_category,
+                confidence_score, classification_method
+            ))
+        
+        values = ", ".join(["(%s, %s, %s, %s, %s)"] * len(results))
         
         cursor = self.conn.cursor()
         try:
             # Store in defect_tags table
-            cursor.execute("""
+            cursor.execute(f"""
                 INSERT INTO defect_tags (
                     tag_id, finding_id, defect_category, 
                     confidence_score, severity_weight
                 )
-                VALUES (%s, %s, %s, %s, %s)
-            """, (tag_id, finding_id, defect_category, confidence_score, severity_weight))
+                VALUES {values}
+            """, tuple(tag_params))
             
             # Store in classification_history for audit trail
-            cursor.execute("""
+            cursor.execute(f"""
                 INSERT INTO classification_history (
                     history_id, finding_id, defect_category,
                     confidence_score, classification_method
                 )
-                VALUES (%s, %s, %s, %s, %s)
-            """, (history_id, finding_id, defect_category, confidence_score, classification_method))
+                VALUES {values}
+            """, tuple(history_params))
             
             self.conn.commit()
-            return tag_id
+            return tag_ids
             
         finally:
             cursor.close()
@@ -392,13 +424,10 @@ class AIClassification:
                 confidence_score = 0.0
             
             # Store all classification results (images can have multiple tags)
-            for defect_tag in validated_tags:
-                self._store_classification_result(
-                    finding_id,
-                    defect_tag,
-                    confidence_score,
-                    'image_ai'
-                )
+            self._store_classification_results(
+                finding_id,
+                [(defect_tag, confidence_score, 'image_ai') for defect_tag in validated_tags]
+            )
             
             # Update finding status to processed
             cursor.execute("""
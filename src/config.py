@@ -4,13 +4,28 @@ Handles environment-specific settings with validation and secure credential mana
 """
 
 import os
+import sys
 import json
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple, Union, TextIO
 from dataclasses import dataclass, field
 from pathlib import Path
 
+# Slotted dataclasses drop the per-instance __dict__; the flag needs Python 3.10+
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+# orjson is optional; its decode error subclasses json.JSONDecodeError
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Decoded configuration files keyed by (absolute path, mtime in ns, size); an
+# edited file gets a new mtime or size and is simply re-read
+_CONFIG_CACHE: Dict[Tuple[str, int, int], Dict[str, Any]] = {}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class DatabaseConfig:
     """Database connection configuration"""
     account: str
@@ -23,6 +38,10 @@ class DatabaseConfig:
     
     def validate(self) -> None:
         """Validate database configuration"""
+        # Fast path: a complete config needs only one short-circuited pass
+        if all((self.account, self.user, self.password, self.warehouse, self.database)):
+            return
+        
         required_fields = {
             'account': self.account,
             'user': self.user,
@@ -48,8 +67,19 @@ class DatabaseConfig:
         }
 
 
-@dataclass
-class CortexAIConfig:
+@dataclass(**_DATACLASS_OPTIONS)
+class _MemoizedValidation:
+    """Base for config sections whose successful validate() is remembered until a field changes"""
+    _validated: bool = field(default=False, init=False, repr=False, compare=False)
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name != '_validated':
+            object.__setattr__(self, '_validated', False)
+        object.__setattr__(self, name, value)
+
+
+@dataclass(**_DATACLASS_OPTIONS)
+class CortexAIConfig(_MemoizedValidation):
     """Cortex AI configuration"""
     enabled: bool = True
     timeout_seconds: int = 30
@@ -58,14 +88,19 @@ class CortexAIConfig:
     
     def validate(self) -> None:
         """Validate Cortex AI configuration"""
+        if self._validated:
+            return
+        
         if self.timeout_seconds <= 0:
             raise ValueError("Cortex AI timeout must be positive")
         if self.retry_count < 0:
             raise ValueError("Cortex AI retry count cannot be negative")
+        
+        self._validated = True
 
 
-@dataclass
-class MonitoringConfig:
+@dataclass(**_DATACLASS_OPTIONS)
+class MonitoringConfig(_MemoizedValidation):
     """Monitoring and alerting configuration"""
     metrics_enabled: bool = True
     log_level: str = "INFO"
@@ -78,6 +113,9 @@ class MonitoringConfig:
     
     def validate(self) -> None:
         """Validate monitoring configuration"""
+        if self._validated:
+            return
+        
         valid_log_levels = ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']
         if self.log_level.upper() not in valid_log_levels:
             raise ValueError(f"Invalid log level: {self.log_level}. Must be one of {valid_log_levels}")
@@ -88,10 +126,12 @@ class MonitoringConfig:
             raise ValueError("Health check interval must be positive")
         if self.error_threshold < 0:
             raise ValueError("Error threshold cannot be negative")
+        
+        self._validated = True
 
 
-@dataclass
-class PerformanceConfig:
+@dataclass(**_DATACLASS_OPTIONS)
+class PerformanceConfig(_MemoizedValidation):
     """Performance optimization configuration"""
     batch_size: int = 100
     max_workers: int = 4
@@ -100,6 +140,9 @@ class PerformanceConfig:
     
     def validate(self) -> None:
         """Validate performance configuration"""
+        if self._validated:
+            return
+        
         if self.batch_size <= 0:
             raise ValueError("Batch size must be positive")
         if self.max_workers <= 0:
@@ -108,9 +151,11 @@ class PerformanceConfig:
             raise ValueError("Cache TTL cannot be negative")
         if self.connection_pool_size <= 0:
             raise ValueError("Connection pool size must be positive")
+        
+        self._validated = True
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class FeatureFlags:
     """Feature flags for enabling/disabling features"""
     enable_image_classification: bool = True
@@ -125,7 +170,7 @@ class FeatureFlags:
         pass
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Config:
     """Main configuration class"""
     environment: str
@@ -186,12 +231,12 @@ class ConfigLoader:
     """Loads configuration from files and environment variables"""
     
     @staticmethod
-    def load_from_file(config_path: str) -> Config:
+    def load_from_file(config_path: Union[str, TextIO]) -> Config:
         """
         Load configuration from JSON file
         
         Args:
-            config_path: Path to configuration file
+            config_path: Path to configuration file, or an open file-like object
             
         Returns:
             Config object
@@ -200,17 +245,23 @@ class ConfigLoader:
             FileNotFoundError: If config file doesn't exist
             ValueError: If config file is invalid
         """
-        path = Path(config_path)
-        if not path.exists():
-            raise FileNotFoundError(f"Configuration file not found: {config_path}")
-        
-        try:
-            with open(path, 'r') as f:
-                config_data = json.load(f)
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Invalid JSON in configuration file: {e}")
+        return ConfigLoader._parse_config_dict(ConfigLoader._read_config_file(config_path))
+    
+    @staticmethod
+    def from_dict(config_data: Dict[str, Any]) -> Config:
+        """
+        Build and validate configuration from an already-parsed dictionary
         
-        return ConfigLoader._parse_config_dict(config_data)
+        Args:
+            config_data: Configuration dictionary in the same shape as the JSON file
+            
+        Returns:
+            Validated Config object
+            
+        Raises:
+            ValueError: If configuration is invalid or incomplete
+        """
+        return ConfigLoader._validated(ConfigLoader._parse_config_dict(config_data))
     
     @staticmethod
     def load_from_env() -> Config:
@@ -280,7 +331,7 @@ class ConfigLoader:
         )
     
     @staticmethod
-    def load(config_path: Optional[str] = None) -> Config:
+    def load(config_path: Optional[Union[str, TextIO]] = None) -> Config:
         """
         Load configuration from file or environment variables
         
@@ -289,8 +340,12 @@ class ConfigLoader:
         2. If CONFIG_FILE env var is set, load from that file
         3. Otherwise, load from environment variables
         
+        The loaders only parse; validation runs exactly once here. It is
+        idempotent, and sections that passed remember it until a field
+        changes, so calling config.validate() again afterwards is cheap.
+        
         Args:
-            config_path: Optional path to configuration file
+            config_path: Optional path to configuration file, or an open file-like object
             
         Returns:
             Validated Config object
@@ -299,14 +354,47 @@ class ConfigLoader:
             ValueError: If configuration is invalid or incomplete
         """
         # Determine config source
+        config_path = config_path or os.getenv('CONFIG_FILE')
         if config_path:
-            config = ConfigLoader.load_from_file(config_path)
-        elif os.getenv('CONFIG_FILE'):
-            config = ConfigLoader.load_from_file(os.getenv('CONFIG_FILE'))
-        else:
-            config = ConfigLoader.load_from_env()
+            return ConfigLoader.from_dict(ConfigLoader._read_config_file(config_path))
+        
+        return ConfigLoader._validated(ConfigLoader.load_from_env())
+    
+    @staticmethod
+    def _read_config_file(config_path: Union[str, TextIO]) -> Dict[str, Any]:
+        """
+        Read and decode a JSON configuration file or file-like object
         
-        # Validate configuration
+        Files are cached by path, mtime and size; callers get a shallow copy, so
+        changing top-level keys of the result never affects later loads.
+        """
+        try:
+            if hasattr(config_path, 'read'):
+                return _json_loads(config_path.read())
+            
+            path = Path(config_path)
+            if not path.exists():
+                raise FileNotFoundError(f"Configuration file not found: {config_path}")
+            
+            stat = path.stat()
+            key = (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+            cached = _CONFIG_CACHE.get(key)
+            if cached is None:
+                with open(path, 'r') as f:
+                    cached = _json_loads(f.read())
+                _CONFIG_CACHE[key] = cached
+            return dict(cached)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON in configuration file: {e}")
+    
+    @staticmethod
+    def clear_cache() -> None:
+        """Forget every cached configuration file"""
+        _CONFIG_CACHE.clear()
+    
+    @staticmethod
+    def _validated(config: Config) -> Config:
+        """Validate configuration, prefixing any error with its origin"""
         try:
             config.validate()
         except ValueError as e:
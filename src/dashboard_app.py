@@ -16,6 +16,9 @@ sys.path.append(os.path.dirname(__file__))
 # Import data access layer
 from dashboard_data import DashboardData
 
+# Display helpers live in a Streamlit-free module so they can be imported cheaply
+from error_sanitizer import sanitize_error_message, get_risk_color, format_date
+
 # Import performance monitoring modules
 try:
     from performance_monitor import get_performance_monitor
@@ -27,68 +30,6 @@ except ImportError:
     PERFORMANCE_MONITORING_AVAILABLE = False
 
 
-def sanitize_error_message(error: Exception) -> str:
-    """
-    Sanitize error messages to hide sensitive details
-    
-    Args:
-        error: Exception object
-        
-    Returns:
-        User-friendly error message without sensitive information
-    """
-    error_str = str(error).lower()
-    
-    # Check for sensitive patterns
-    sensitive_patterns = [
-        'password', 'connection string', 'api key', 'secret',
-        'token', 'credential', 'host=', 'user=', 'pwd=',
-        'database=', 'server=', '/home/', '/usr/', 'c:\\',
-        'snowflake.snowflakecomputing.com'
-    ]
-    
-    for pattern in sensitive_patterns:
-        if pattern in error_str:
-            return "An error occurred while processing your request. Please contact support."
-    
-    # Return generic message for any database or system errors
-    if any(keyword in error_str for keyword in ['database', 'connection', 'query', 'sql']):
-        return "Unable to retrieve data. Please try again later."
-    
-    # For other errors, return a generic message
-    return "An unexpected error occurred. Please try again."
-
-
-def get_risk_color(risk_category: Optional[str]) -> str:
-    """
-    Get color code for risk category
-    
-    Args:
-        risk_category: Risk level (Low, Medium, High)
-        
-    Returns:
-        Color code for display
-    """
-    if not risk_category:
-        return "gray"
-    
-    risk_colors = {
-        'Low': 'green',
-        'Medium': 'orange',
-        'High': 'red'
-    }
-    return risk_colors.get(risk_category, 'gray')
-
-
-def format_date(date_obj) -> str:
-    """Format date for display"""
-    if date_obj is None:
-        return "N/A"
-    if isinstance(date_obj, str):
-        return date_obj
-    return date_obj.strftime("%Y-%m-%d")
-
-
 def display_property_list(dashboard: DashboardData, filters: Dict[str, Any]):
     """
     Display the property list view with filters
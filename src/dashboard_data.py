@@ -9,6 +9,12 @@ from typing import Dict, List, Optional, Any
 class DashboardData:
     """Handles data access operations for the dashboard"""
     
+    # Columns returned by the property list queries, in row order
+    PROPERTY_LIST_COLUMNS = (
+        'property_id', 'location', 'inspection_date',
+        'risk_category', 'risk_score', 'summary_text'
+    )
+    
     def __init__(self, snowflake_connection):
         """
         Initialize dashboard data access component
@@ -22,7 +28,8 @@ class DashboardData:
         self,
         risk_level: Optional[str] = None,
         defect_type: Optional[str] = None,
-        search_term: Optional[str] = None
+        search_term: Optional[str] = None,
+        property_ids: Optional[List[str]] = None
     ) -> List[Dict[str, Any]]:
         """
         Retrieve list of all properties with optional filtering
@@ -31,6 +38,8 @@ class DashboardData:
             risk_level: Filter by risk category ('Low', 'Medium', 'High')
             defect_type: Filter by defect category
             search_term: Search in location, identifier, or summary
+            property_ids: Restrict the result to these property identifiers;
+                an empty list matches nothing
             
         Returns:
             List of property dictionaries with required fields:
@@ -40,6 +49,70 @@ class DashboardData:
             - risk_category
             - risk_score
         """
+        rows = self._fetch_property_rows(risk_level, defect_type, search_term, property_ids)
+        
+        # Format results
+        properties = []
+        for row in rows:
+            properties.append({
+                'property_id': row[0],
+                'location': row[1],
+                'inspection_date': row[2],
+                'risk_category': row[3],
+                'risk_score': row[4],
+                'summary_text': row[5]
+            })
+        
+        return properties
+    
+    def get_property_list_columnar(
+        self,
+        risk_level: Optional[str] = None,
+        defect_type: Optional[str] = None,
+        search_term: Optional[str] = None,
+        property_ids: Optional[List[str]] = None
+    ) -> Dict[str, List[Any]]:
+        """
+        Retrieve the same properties as get_property_list, one list per column
+        
+        Avoids building a dictionary per row when the caller only needs whole
+        columns, e.g. set(result['property_id']).
+        
+        Args:
+            risk_level: Filter by risk category ('Low', 'Medium', 'High')
+            defect_type: Filter by defect category
+            search_term: Search in location, identifier, or summary
+            property_ids: Restrict the result to these property identifiers;
+                an empty list matches nothing
+            
+        Returns:
+            Dictionary mapping each of property_id, location, inspection_date,
+            risk_category, risk_score and summary_text to a list of values in
+            row order
+        """
+        rows = self._fetch_property_rows(risk_level, defect_type, search_term, property_ids)
+        columns = list(zip(*rows)) if rows else [()] * len(self.PROPERTY_LIST_COLUMNS)
+        
+        return {
+            name: list(values)
+            for name, values in zip(self.PROPERTY_LIST_COLUMNS, columns)
+        }
+    
+    def _fetch_property_rows(
+        self,
+        risk_level: Optional[str],
+        defect_type: Optional[str],
+        search_term: Optional[str],
+        property_ids: Optional[List[str]]
+    ) -> List[tuple]:
+        """
+        Run the filtered property list query and return its raw rows
+        
+        Rows hold the columns of PROPERTY_LIST_COLUMNS in that order.
+        """
+        if property_ids is not None and not property_ids:
+            return []
+        
         cursor = self.conn.cursor()
         try:
             # Build base query
@@ -81,6 +154,11 @@ class DashboardData:
                 search_pattern = f"%{search_term}%"
                 params.extend([search_pattern, search_pattern, search_pattern])
             
+            if property_ids:
+                placeholders = ', '.join(['%s'] * len(property_ids))
+                where_clauses.append(f"p.property_id IN ({placeholders})")
+                params.extend(property_ids)
+            
             if where_clauses:
                 query += " WHERE " + " AND ".join(where_clauses)
             
@@ -88,22 +166,7 @@ class DashboardData:
             
             # Execute query
             cursor.execute(query, tuple(params) if params else None)
-            rows = cursor.fetchall()
-            
-            # Format results
-            properties = []
-            for row in rows:
-                properties.append({
-                    'property_id': row[0],
-                    'location': row[1],
-                    'inspection_date': row[2],
-                    'risk_category': row[3],
-                    'risk_score': row[4],
-                    'summary_text': row[5]
-                })
-            
-            return properties
-            
+            return cursor.fetchall()
         finally:
             cursor.close()
 
@@ -3,7 +3,7 @@ Data Ingestion Component for AI-Assisted Home Inspection Workspace
 Handles uploads of property metadata, room information, text findings, and image files
 """
 
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import date
 import uuid
 
@@ -55,6 +55,41 @@ class DataIngestion:
         finally:
             cursor.close()
     
+    def ingest_properties_bulk(self, properties: List[Dict]) -> List[str]:
+        """
+        Ingest several properties with one batched INSERT and a single commit
+        
+        Args:
+            properties: List of dictionaries containing property_id, location, inspection_date
+            
+        Returns:
+            List of property_ids in input order
+            
+        Raises:
+            ValueError: If any property is missing a required field
+        """
+        required_fields = ['property_id', 'location', 'inspection_date']
+        for property_data in properties:
+            for field in required_fields:
+                if field not in property_data:
+                    raise ValueError(f"Missing required field: {field}")
+        
+        rows = [
+            (p['property_id'], p['location'], p['inspection_date'])
+            for p in properties
+        ]
+        
+        cursor = self.conn.cursor()
+        try:
+            cursor.executemany("""
+                INSERT INTO properties (property_id, location, inspection_date)
+                VALUES (%s, %s, %s)
+            """, rows)
+            self.conn.commit()
+            return [row[0] for row in rows]
+        finally:
+            cursor.close()
+    
     def get_property(self, property_id: str) -> Optional[Dict]:
         """
         Retrieve property metadata from the database
@@ -78,17 +113,50 @@ class DataIngestion:
             if row is None:
                 return None
             
-            return {
-                'property_id': row[0],
-                'location': row[1],
-                'inspection_date': row[2],
-                'risk_score': row[3],
-                'risk_category': row[4],
-                'summary_text': row[5]
-            }
+            return self._property_from_row(row)
         finally:
             cursor.close()
     
+    def get_properties(self, property_ids: List[str]) -> Dict[str, Dict]:
+        """
+        Retrieve metadata for several properties with a single query
+        
+        Args:
+            property_ids: Unique identifiers of the properties
+            
+        Returns:
+            Dictionary mapping each found property_id to its property data;
+            ids that are not stored are absent
+        """
+        if not property_ids:
+            return {}
+        
+        placeholders = ', '.join(['%s'] * len(property_ids))
+        cursor = self.conn.cursor()
+        try:
+            cursor.execute(f"""
+                SELECT property_id, location, inspection_date, risk_score, 
+                       risk_category, summary_text
+                FROM properties
+                WHERE property_id IN ({placeholders})
+            """, tuple(property_ids))
+            
+            return {row[0]: self._property_from_row(row) for row in cursor.fetchall()}
+        finally:
+            cursor.close()
+    
+    @staticmethod
+    def _property_from_row(row) -> Dict:
+        """Map a properties row selected in get_property column order to a dict"""
+        return {
+            'property_id': row[0],
+            'location': row[1],
+            'inspection_date': row[2],
+            'risk_score': row[3],
+            'risk_category': row[4],
+            'summary_text': row[5]
+        }
+    
     def ingest_room(self, room_data: Dict, property_id: str) -> str:
         """
         Ingest room information linked to a property
@@ -176,6 +244,59 @@ class DataIngestion:
         finally:
             cursor.close()
     
+    def ingest_rooms_with_findings(
+        self,
+        rooms_and_findings: List[Tuple[Dict, List[str]]],
+        property_id: str
+    ) -> List[Tuple[str, List[str]]]:
+        """
+        Ingest rooms together with their text findings using one batched INSERT
+        per table and a single commit
+        
+        Finding ids are generated client-side so both batches can be sent
+        without reading anything back in between.
+        
+        Args:
+            rooms_and_findings: List of (room_data, notes) pairs, where room_data
+                contains room_id, room_type, room_location and notes are the text
+                descriptions of that room's findings
+            property_id: ID of the parent property
+            
+        Returns:
+            List of (room_id, finding_ids) pairs in input order
+        """
+        required_fields = ['room_id', 'room_type']
+        for room_data, _ in rooms_and_findings:
+            for field in required_fields:
+                if field not in room_data:
+                    raise ValueError(f"Missing required field: {field}")
+        
+        room_rows = []
+        finding_rows = []
+        result = []
+        for room_data, notes in rooms_and_findings:
+            room_id = room_data['room_id']
+            room_rows.append((room_id, property_id, room_data['room_type'], room_data.get('room_location')))
+            rows = [(str(uuid.uuid4()), room_id, note) for note in notes]
+            finding_rows.extend(rows)
+            result.append((room_id, [row[0] for row in rows]))
+        
+        cursor = self.conn.cursor()
+        try:
+            cursor.executemany("""
+                INSERT INTO rooms (room_id, property_id, room_type, room_location)
+                VALUES (%s, %s, %s, %s)
+            """, room_rows)
+            if finding_rows:
+                cursor.executemany("""
+                    INSERT INTO findings (finding_id, room_id, finding_type, note_text)
+                    VALUES (%s, %s, 'text', %s)
+                """, finding_rows)
+            self.conn.commit()
+            return result
+        finally:
+            cursor.close()
+    
     def ingest_image_finding(self, image_file: bytes, filename: str, room_id: str) -> str:
         """
         Ingest image finding linked to a room
@@ -0,0 +1,76 @@
+"""
+Display helpers for the Streamlit dashboard
+Error sanitization and formatting with no Streamlit dependency
+"""
+
+import re
+from datetime import date
+from types import MappingProxyType
+from typing import Optional
+
+# Lowercase substrings that mark an error message as exposing sensitive details
+_SENSITIVE_PATTERNS = (
+    'password', 'connection string', 'api key', 'secret',
+    'token', 'credential', 'host=', 'user=', 'pwd=',
+    'database=', 'server=', '/home/', '/usr/', 'c:\\',
+    'snowflake.snowflakecomputing.com'
+)
+# Each list is matched in one pass by a single compiled alternation
+_SENSITIVE_RE = re.compile('|'.join(map(re.escape, _SENSITIVE_PATTERNS)))
+_DATA_ERROR_RE = re.compile('database|connection|query|sql')
+
+# Display color per risk category; anything else (including None) is gray
+_RISK_COLORS = MappingProxyType({
+    'Low': 'green',
+    'Medium': 'orange',
+    'High': 'red'
+})
+
+
+def sanitize_error_message(error: Exception) -> str:
+    """
+    Sanitize error messages to hide sensitive details
+    
+    Args:
+        error: Exception object
+        
+    Returns:
+        User-friendly error message without sensitive information
+    """
+    error_str = str(error).lower()
+    
+    # Check for sensitive patterns
+    if _SENSITIVE_RE.search(error_str):
+        return "An error occurred while processing your request. Please contact support."
+    
+    # Return generic message for any database or system errors
+    if _DATA_ERROR_RE.search(error_str):
+        return "Unable to retrieve data. Please try again later."
+    
+    # For other errors, return a generic message
+    return "An unexpected error occurred. Please try again."
+
+
+def get_risk_color(risk_category: Optional[str]) -> str:
+    """
+    Get color code for risk category
+    
+    Args:
+        risk_category: Risk level (Low, Medium, High)
+        
+    Returns:
+        Color code for display
+    """
+    return _RISK_COLORS.get(risk_category, 'gray')
+
+
+def format_date(date_obj) -> str:
+    """Format date for display"""
+    if date_obj is None:
+        return "N/A"
+    if isinstance(date_obj, str):
+        return date_obj
+    # Plain dates already render as YYYY-MM-DD without going through strftime
+    if type(date_obj) is date:
+        return date_obj.isoformat()
+    return date_obj.strftime("%Y-%m-%d")
@@ -3,29 +3,46 @@ Sample Data Generation Script for AI-Assisted Home Inspection Workspace
 Generates realistic sample properties with various defect combinations for testing
 """
 
+import re
 import uuid
 from datetime import date, timedelta
-from typing import List, Dict, Tuple
+from types import MappingProxyType
+from typing import List, Dict, NamedTuple, Tuple
 from src.data_ingestion import DataIngestion
 from src.ai_classification import AIClassification
 from src.risk_scoring import RiskScoring
 from src.summary_generation import SummaryGeneration
 
 
+# Image paths flagged as missing/corrupted are skipped during classification
+_BAD_PATH_RE = re.compile(r'missing|corrupted|notfound|nonexistent', re.IGNORECASE)
+
+
+def _new_id() -> str:
+    """Random identifier for sample rows (hex form skips the dash formatting)"""
+    return uuid.uuid4().hex
+
+
+class DefectScenario(NamedTuple):
+    """Text notes and image filenames used for one risk level"""
+    text_notes: Tuple[str, ...]
+    image_files: Tuple[str, ...]
+
+
 class SampleDataGenerator:
     """Generates sample inspection data for testing and demonstration"""
     
     # Sample property locations
-    LOCATIONS = [
+    LOCATIONS = (
         "123 Main St, Springfield",
         "456 Oak Ave, Riverside",
         "789 Elm Rd, Lakeside",
         "321 Pine Dr, Hillview",
         "654 Maple Ln, Greenfield"
-    ]
+    )
     
     # Sample room types
-    ROOM_TYPES = [
+    ROOM_TYPES = (
         "Kitchen",
         "Living Room",
         "Bedroom",
@@ -33,57 +50,57 @@ class SampleDataGenerator:
         "Basement",
         "Attic",
         "Garage"
-    ]
+    )
     
     # Sample defect scenarios
-    DEFECT_SCENARIOS = {
-        'high_risk': {
-            'text_notes': [
+    DEFECT_SCENARIOS = MappingProxyType({
+        'high_risk': DefectScenario(
+            text_notes=(
                 "Exposed wiring visible behind outlet",
                 "Severe damp wall with visible water stains",
                 "Black mold growth on ceiling",
                 "Active water leak from ceiling pipe"
-            ],
-            'image_files': [
+            ),
+            image_files=(
                 "exposed_wiring_outlet.jpg",
                 "damp_wall_stains.jpg",
                 "mold_ceiling.jpg",
                 "water_leak_pipe.jpg"
-            ]
-        },
-        'medium_risk': {
-            'text_notes': [
+            )
+        ),
+        'medium_risk': DefectScenario(
+            text_notes=(
                 "Large crack in wall near window",
                 "Minor water leak under sink",
                 "Small damp patch on wall"
-            ],
-            'image_files': [
+            ),
+            image_files=(
                 "crack_wall_window.jpg",
                 "water_leak_sink.jpg",
                 "damp_patch.jpg"
-            ]
-        },
-        'low_risk': {
-            'text_notes': [
+            )
+        ),
+        'low_risk': DefectScenario(
+            text_notes=(
                 "Small hairline crack in ceiling",
                 "Minor cosmetic crack in plaster"
-            ],
-            'image_files': [
+            ),
+            image_files=(
                 "hairline_crack.jpg",
                 "cosmetic_crack.jpg"
-            ]
-        },
-        'no_defects': {
-            'text_notes': [
+            )
+        ),
+        'no_defects': DefectScenario(
+            text_notes=(
                 "Room appears in good condition",
                 "No visible defects observed"
-            ],
-            'image_files': [
+            ),
+            image_files=(
                 "clean_room.jpg",
                 "good_condition.jpg"
-            ]
-        }
-    }
+            )
+        )
+    })
     
     def __init__(self, snowflake_connection):
         """
@@ -114,7 +131,7 @@ class SampleDataGenerator:
             Tuple of (property_id, property_data)
         """
         # Generate property metadata
-        property_id = str(uuid.uuid4())
+        property_id = _new_id()
         location = self.LOCATIONS[hash(property_id) % len(self.LOCATIONS)]
         inspection_date = date.today() - timedelta(days=hash(property_id) % 30)
         
@@ -130,7 +147,7 @@ class SampleDataGenerator:
         # Generate rooms with findings
         rooms = []
         for i in range(num_rooms):
-            room_id = str(uuid.uuid4())
+            room_id = _new_id()
             room_type = self.ROOM_TYPES[i % len(self.ROOM_TYPES)]
             room_location = f"Floor {(i // 3) + 1}"
             
@@ -184,9 +201,10 @@ class SampleDataGenerator:
         }.get(risk_level, 2)
         
         # Add text findings
-        for i in range(min(num_findings, len(scenario['text_notes']))):
-            note_index = (room_index + i) % len(scenario['text_notes'])
-            note = scenario['text_notes'][note_index]
+        text_notes = scenario.text_notes
+        num_notes = len(text_notes)
+        for i in range(min(num_findings, num_notes)):
+            note = text_notes[(room_index + i) % num_notes]
             finding_id = self.data_ingestion.ingest_text_finding(note, room_id)
             findings.append({
                 'finding_id': finding_id,
@@ -195,9 +213,10 @@ class SampleDataGenerator:
             })
         
         # Add image findings
-        for i in range(min(num_findings, len(scenario['image_files']))):
-            image_index = (room_index + i) % len(scenario['image_files'])
-            filename = scenario['image_files'][image_index]
+        image_files = scenario.image_files
+        num_images = len(image_files)
+        for i in range(min(num_findings, num_images)):
+            filename = image_files[(room_index + i) % num_images]
             # Create dummy image data
             image_data = b'dummy_image_data'
             finding_id = self.data_ingestion.ingest_image_finding(
@@ -230,9 +249,8 @@ class SampleDataGenerator:
                 WHERE r.property_id = %s
             """, (property_id,))
             
-            findings = cursor.fetchall()
-            
-            for finding in findings:
+            # Iterate the cursor so rows stream instead of being materialized
+            for finding in cursor:
                 finding_id = finding[0]
                 finding_type = finding[1]
                 note_text = finding[2]
@@ -243,7 +261,7 @@ class SampleDataGenerator:
                         self.ai_classification.classify_text_finding(finding_id, note_text)
                     elif finding_type == 'image' and image_stage_path:
                         # Make sure image path doesn't contain 'missing' or 'corrupted'
-                        if image_stage_path and not any(word in image_stage_path.lower() for word in ['missing', 'corrupted', 'notfound', 'nonexistent']):
+                        if image_stage_path and not _BAD_PATH_RE.search(image_stage_path):
                             self.ai_classification.classify_image_finding(finding_id, image_stage_path)
                 except ValueError as ve:
                     # ValueError indicates missing/corrupted image - skip
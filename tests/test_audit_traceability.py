@@ -4,109 +4,108 @@ Feature: ai-home-inspection
 """
 
 import pytest
-from hypothesis import given, strategies as st, settings
-from datetime import date, timedelta, datetime
-import sys
-import os
-import uuid
+from hypothesis import given, strategies as st
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from data_ingestion import DataIngestion
-from ai_classification import AIClassification
+# Strategies are built once at import; the composite below only draws from them
+_NOTE_TEMPLATES = st.sampled_from([
+    'Found {defect} in the {location}',
+    'There is {defect} visible on the {surface}',
+    'Noticed {defect} near the {location}',
+    'Significant {defect} detected',
+    '{defect} present in this area',
+    'No issues found',
+    'Everything looks good',
+    'Area is clean and well-maintained'
+])
 
+_NOTE_DEFECTS = st.sampled_from([
+    'a crack', 'cracks', 'a large crack',
+    'damp wall', 'dampness', 'moisture on the wall',
+    'exposed wiring', 'exposed wires', 'live wires',
+    'mold', 'mold growth', 'mildew',
+    'water leak', 'leaking water', 'water damage',
+    'nothing unusual'
+])
 
-# Test data generators
-@st.composite
-def property_data(draw):
-    """Generate valid property data for testing"""
-    property_id = draw(st.uuids()).hex
-    location = draw(st.text(
-        alphabet=st.characters(whitelist_categories=('Lu', 'Ll', 'Nd', 'Zs', 'Pd')),
-        min_size=1,
-        max_size=100
-    ))
-    base_date = date(2020, 1, 1)
-    days_offset = draw(st.integers(min_value=0, max_value=2000))
-    inspection_date = base_date + timedelta(days=days_offset)
-    
-    return {
-        'property_id': property_id,
-        'location': location,
-        'inspection_date': inspection_date
-    }
+_NOTE_LOCATIONS = st.sampled_from(['ceiling', 'floor', 'wall', 'corner', 'window', 'door'])
+_NOTE_SURFACES = st.sampled_from(['wall', 'ceiling', 'floor', 'surface'])
 
-
-@st.composite
-def room_data(draw):
-    """Generate valid room data for testing"""
-    room_id = draw(st.uuids()).hex
-    room_type = draw(st.sampled_from([
-        'kitchen', 'bedroom', 'bathroom', 'living room', 
-        'dining room', 'basement', 'attic', 'garage'
-    ]))
-    room_location = draw(st.one_of(
-        st.none(),
-        st.text(
-            alphabet=st.characters(whitelist_categories=('Lu', 'Ll', 'Nd', 'Zs', 'Pd')),
-            min_size=1,
-            max_size=50
-        )
-    ))
-    
-    return {
-        'room_id': room_id,
-        'room_type': room_type,
-        'room_location': room_location
-    }
+_NOTE_CONTEXT = st.text(
+    alphabet=st.characters(whitelist_categories=('Lu', 'Ll', 'Nd', 'Zs', 'Po')),
+    min_size=0,
+    max_size=100
+)
 
 
+# Test data generators
 @st.composite
 def text_finding_note(draw):
     """Generate text notes that may contain defect keywords"""
-    defect_templates = [
-        'Found {defect} in the {location}',
-        'There is {defect} visible on the {surface}',
-        'Noticed {defect} near the {location}',
-        'Significant {defect} detected',
-        '{defect} present in this area',
-        'No issues found',
-        'Everything looks good',
-        'Area is clean and well-maintained'
-    ]
-    
-    defects = [
-        'a crack', 'cracks', 'a large crack',
-        'damp wall', 'dampness', 'moisture on the wall',
-        'exposed wiring', 'exposed wires', 'live wires',
-        'mold', 'mold growth', 'mildew',
-        'water leak', 'leaking water', 'water damage',
-        'nothing unusual'
-    ]
-    
-    locations = ['ceiling', 'floor', 'wall', 'corner', 'window', 'door']
-    surfaces = ['wall', 'ceiling', 'floor', 'surface']
-    
-    template = draw(st.sampled_from(defect_templates))
-    defect = draw(st.sampled_from(defects))
-    location = draw(st.sampled_from(locations))
-    surface = draw(st.sampled_from(surfaces))
+    template = draw(_NOTE_TEMPLATES)
+    defect = draw(_NOTE_DEFECTS)
+    location = draw(_NOTE_LOCATIONS)
+    surface = draw(_NOTE_SURFACES)
     
     note = template.format(defect=defect, location=location, surface=surface)
     
     # Sometimes add additional context
     if draw(st.booleans()):
-        additional = draw(st.text(
-            alphabet=st.characters(whitelist_categories=('Lu', 'Ll', 'Nd', 'Zs', 'Po')),
-            min_size=0,
-            max_size=100
-        ))
-        note = note + '. ' + additional
+        note = note + '. ' + draw(_NOTE_CONTEXT)
     
     return note
 
 
+# Built once and shared by every @given below
+_NOTE = text_finding_note()
+
+
+# Statements run through the module's prepared_cursor, keyed by name
+SQL_STATEMENTS = {
+    'history_detail_v1': """
+        SELECT history_id, finding_id, defect_category, 
+               confidence_score, classification_method, classified_at
+        FROM classification_history
+        WHERE finding_id = %s
+    """,
+    'integrity_check_v1': """
+        SELECT
+            (SELECT property_id FROM properties
+             WHERE property_id = %s) AS property_ref,
+            (SELECT COUNT(*) FROM rooms
+             WHERE property_id = %s AND room_id = %s) AS room_ref,
+            (SELECT COUNT(*) FROM findings
+             WHERE room_id = %s AND finding_id = %s) AS finding_ref,
+            (SELECT COUNT(*) FROM defect_tags
+             WHERE finding_id = %s) AS tag_count,
+            (SELECT COUNT(*) FROM classification_history
+             WHERE finding_id = %s) AS history_count
+    """,
+    'tag_summary_v1': """
+        SELECT tag_id, defect_category, confidence_score
+        FROM defect_tags
+        WHERE finding_id = %s
+    """,
+    'history_summary_v1': """
+        SELECT history_id, defect_category, confidence_score, classification_method
+        FROM classification_history
+        WHERE finding_id = %s
+    """,
+    'history_summary_ordered_v1': """
+        SELECT history_id, defect_category, confidence_score, classification_method
+        FROM classification_history
+        WHERE finding_id = %s
+        ORDER BY classified_at
+    """,
+    'delete_tags_v1': "DELETE FROM defect_tags WHERE finding_id = %s",
+    'tag_categories_v1': """
+        SELECT defect_category
+        FROM defect_tags
+        WHERE finding_id = %s
+    """
+}
+
+
 class TestClassificationMetadataRecording:
     """
     **Feature: ai-home-inspection, Property 28: Classification metadata is recorded**
@@ -115,18 +114,14 @@ class TestClassificationMetadataRecording:
     a timestamp and confidence score for that classification.
     """
     
-    @given(
-        prop_data=property_data(),
-        rm_data=room_data(),
-        note_text=text_finding_note()
-    )
-    @settings(max_examples=100)
+    @given(note_text=_NOTE)
     def test_classification_metadata_is_recorded(
         self,
-        prop_data,
-        rm_data,
         note_text,
-        snowflake_connection
+        ingestion_components,
+        property_room_scaffold,
+        db_savepoint,
+        prepared_cursor
     ):
         """
         **Feature: ai-home-inspection, Property 28: Classification metadata is recorded**
@@ -135,68 +130,50 @@ class TestClassificationMetadataRecording:
         Test that classification metadata (timestamp, confidence score) is recorded
         for every defect tag assigned to a finding.
         """
-        # Arrange
-        ingestion = DataIngestion(snowflake_connection)
-        classifier = AIClassification(snowflake_connection)
-        
-        # Create property and room
-        property_id = ingestion.ingest_property(prop_data)
-        room_id = ingestion.ingest_room(rm_data, property_id)
-        
-        # Create text finding
-        finding_id = ingestion.ingest_text_finding(note_text, room_id)
-        
-        # Record time before classification
-        time_before = datetime.now()
+        # Arrange - property and room come from the module scaffold
+        ingestion, classifier = ingestion_components
+        _, room_id = property_room_scaffold
         
-        # Act - Classify the text finding
-        defect_tags = classifier.classify_text_finding(finding_id, note_text)
-        
-        # Record time after classification
-        time_after = datetime.now()
-        
-        # Act - Retrieve the stored classification metadata
-        stored_tags = classifier.get_defect_tags(finding_id)
-        
-        # Assert - Classification metadata should be recorded
-        assert stored_tags is not None, "Should be able to retrieve stored tags"
-        assert len(stored_tags) > 0, "At least one tag should be stored"
-        
-        # Assert - Each stored tag should have required metadata
-        for tag in stored_tags:
-            # Check confidence score is recorded
-            assert tag['confidence_score'] is not None, \
-                "Confidence score must be recorded for classification"
-            assert isinstance(tag['confidence_score'], (int, float)), \
-                "Confidence score must be numeric"
-            assert 0.0 <= tag['confidence_score'] <= 1.0, \
-                "Confidence score must be between 0.0 and 1.0"
+        with db_savepoint():
+            # Create text finding
+            finding_id = ingestion.ingest_text_finding(note_text, room_id)
             
-            # Check timestamp is recorded (classified_at field)
-            # Note: In mock DB this might be None, but in real DB it would have a timestamp
-            # We verify the field exists in the returned data
-            assert 'classified_at' in tag, \
-                "Timestamp field (classified_at) must exist in classification record"
+            # Act - Classify the text finding
+            defect_tags = classifier.classify_text_finding(finding_id, note_text)
             
-            # Check severity weight is recorded
-            assert tag['severity_weight'] is not None, \
-                "Severity weight must be recorded"
-            assert isinstance(tag['severity_weight'], int), \
-                "Severity weight must be an integer"
-            assert tag['severity_weight'] >= 0, \
-                "Severity weight must be non-negative"
-        
-        # Assert - Check classification_history table also has the metadata
-        cursor = snowflake_connection.cursor()
-        try:
-            cursor.execute("""
-                SELECT history_id, finding_id, defect_category, 
-                       confidence_score, classification_method, classified_at
-                FROM classification_history
-                WHERE finding_id = %s
-            """, (finding_id,))
+            # Act - Retrieve the stored classification metadata
+            stored_tags = classifier.get_defect_tags(finding_id)
             
-            history_records = cursor.fetchall()
+            # Assert - Classification metadata should be recorded
+            assert stored_tags is not None, "Should be able to retrieve stored tags"
+            assert len(stored_tags) > 0, "At least one tag should be stored"
+            
+            # Assert - Each stored tag should have required metadata
+            for tag in stored_tags:
+                # Check confidence score is recorded
+                assert tag['confidence_score'] is not None, \
+                    "Confidence score must be recorded for classification"
+                assert isinstance(tag['confidence_score'], (int, float)), \
+                    "Confidence score must be numeric"
+                assert 0.0 <= tag['confidence_score'] <= 1.0, \
+                    "Confidence score must be between 0.0 and 1.0"
+                
+                # Check timestamp is recorded (classified_at field)
+                # Note: In mock DB this might be None, but in real DB it would have a timestamp
+                # We verify the field exists in the returned data
+                assert 'classified_at' in tag, \
+                    "Timestamp field (classified_at) must exist in classification record"
+                
+                # Check severity weight is recorded
+                assert tag['severity_weight'] is not None, \
+                    "Severity weight must be recorded"
+                assert isinstance(tag['severity_weight'], int), \
+                    "Severity weight must be an integer"
+                assert tag['severity_weight'] >= 0, \
+                    "Severity weight must be non-negative"
+            
+            # Assert - Check classification_history table also has the metadata
+            history_records = prepared_cursor.run('history_detail_v1', (finding_id,)).fetchall()
             
             assert len(history_records) > 0, \
                 "Classification history should be recorded"
@@ -217,16 +194,6 @@ class TestClassificationMetadataRecording:
                     "Classification method should be valid"
                 # classified_at field is returned (6th element in tuple)
                 # In mock it may be None, but the field exists in the schema
-        
-        finally:
-            # Clean up
-            cursor.execute("DELETE FROM defect_tags WHERE finding_id = %s", (finding_id,))
-            cursor.execute("DELETE FROM classification_history WHERE finding_id = %s", (finding_id,))
-            cursor.execute("DELETE FROM findings WHERE finding_id = %s", (finding_id,))
-            cursor.execute("DELETE FROM rooms WHERE room_id = %s", (room_id,))
-            cursor.execute("DELETE FROM properties WHERE property_id = %s", (property_id,))
-            snowflake_connection.commit()
-            cursor.close()
 
 
 class TestReferentialIntegrityMaintenance:
@@ -237,18 +204,14 @@ class TestReferentialIntegrityMaintenance:
     between properties, rooms, and findings should remain valid.
     """
     
-    @given(
-        prop_data=property_data(),
-        rm_data=room_data(),
-        note_text=text_finding_note()
-    )
-    @settings(max_examples=100)
+    @given(note_text=_NOTE)
     def test_referential_integrity_maintenance(
         self,
-        prop_data,
-        rm_data,
         note_text,
-        snowflake_connection
+        ingestion_components,
+        property_room_scaffold,
+        db_savepoint,
+        prepared_cursor
     ):
         """
         **Feature: ai-home-inspection, Property 31: Referential integrity maintenance**
@@ -256,99 +219,33 @@ class TestReferentialIntegrityMaintenance:
         
         Test that referential integrity is maintained across all database operations.
         """
-        # Arrange
-        ingestion = DataIngestion(snowflake_connection)
-        classifier = AIClassification(snowflake_connection)
+        # Arrange - property and room come from the module scaffold
+        ingestion, classifier = ingestion_components
+        property_id, room_id = property_room_scaffold
         
-        # Act - Create property, room, finding, and classification
-        property_id = ingestion.ingest_property(prop_data)
-        room_id = ingestion.ingest_room(rm_data, property_id)
-        finding_id = ingestion.ingest_text_finding(note_text, room_id)
-        defect_tags = classifier.classify_text_finding(finding_id, note_text)
-        
-        # Assert - Verify all relationships are valid
-        cursor = snowflake_connection.cursor()
-        try:
-            # Check room references valid property
-            cursor.execute("""
-                SELECT r.room_id, r.property_id, p.property_id
-                FROM rooms r
-                JOIN properties p ON r.property_id = p.property_id
-                WHERE r.room_id = %s
-            """, (room_id,))
-            room_result = cursor.fetchone()
-            assert room_result is not None, \
-                "Room should reference a valid property"
-            assert room_result[1] == room_result[2], \
-                "Room's property_id should match actual property"
+        with db_savepoint():
+            # Act - Create finding and classification
+            finding_id = ingestion.ingest_text_finding(note_text, room_id)
+            defect_tags = classifier.classify_text_finding(finding_id, note_text)
+            
+            # Assert - Check every relationship with one projection query
+            property_ref, room_ref, finding_ref, tag_count, history_count = prepared_cursor.run(
+                'integrity_check_v1',
+                (property_id, property_id, room_id, room_id, finding_id, finding_id, finding_id)
+            ).fetchone()
             
-            # Check finding references valid room
-            cursor.execute("""
-                SELECT f.finding_id, f.room_id, r.room_id
-                FROM findings f
-                JOIN rooms r ON f.room_id = r.room_id
-                WHERE f.finding_id = %s
-            """, (finding_id,))
-            finding_result = cursor.fetchone()
-            assert finding_result is not None, \
+            assert property_ref == property_id, \
+                "Property should exist"
+            assert room_ref == 1, \
+                "Room should reference a valid property"
+            assert finding_ref == 1, \
                 "Finding should reference a valid room"
-            assert finding_result[1] == finding_result[2], \
-                "Finding's room_id should match actual room"
             
-            # Check defect_tags reference valid finding
-            cursor.execute("""
-                SELECT dt.tag_id, dt.finding_id, f.finding_id
-                FROM defect_tags dt
-                JOIN findings f ON dt.finding_id = f.finding_id
-                WHERE dt.finding_id = %s
-            """, (finding_id,))
-            tag_results = cursor.fetchall()
-            assert len(tag_results) > 0, \
+            # Tags and history are keyed by a finding proven to exist above
+            assert tag_count > 0, \
                 "Defect tags should reference valid finding"
-            for tag_result in tag_results:
-                assert tag_result[1] == tag_result[2], \
-                    "Tag's finding_id should match actual finding"
-            
-            # Check classification_history references valid finding
-            cursor.execute("""
-                SELECT ch.history_id, ch.finding_id, f.finding_id
-                FROM classification_history ch
-                JOIN findings f ON ch.finding_id = f.finding_id
-                WHERE ch.finding_id = %s
-            """, (finding_id,))
-            history_results = cursor.fetchall()
-            assert len(history_results) > 0, \
+            assert history_count > 0, \
                 "Classification history should reference valid finding"
-            for history_result in history_results:
-                assert history_result[1] == history_result[2], \
-                    "History's finding_id should match actual finding"
-            
-            # Test cascade behavior - attempt to delete property without cleaning up children
-            # This should fail in a real DB with foreign key constraints
-            # In our mock, we'll verify the constraint would be violated
-            
-            # First, verify all child records exist
-            cursor.execute("SELECT COUNT(*) FROM rooms WHERE property_id = %s", (property_id,))
-            room_count = cursor.fetchone()[0]
-            assert room_count > 0, "Property should have child rooms"
-            
-            cursor.execute("""
-                SELECT COUNT(*) FROM findings f
-                JOIN rooms r ON f.room_id = r.room_id
-                WHERE r.property_id = %s
-            """, (property_id,))
-            finding_count = cursor.fetchone()[0]
-            assert finding_count > 0, "Property should have child findings through rooms"
-            
-        finally:
-            # Clean up in correct order (respecting foreign keys)
-            cursor.execute("DELETE FROM defect_tags WHERE finding_id = %s", (finding_id,))
-            cursor.execute("DELETE FROM classification_history WHERE finding_id = %s", (finding_id,))
-            cursor.execute("DELETE FROM findings WHERE finding_id = %s", (finding_id,))
-            cursor.execute("DELETE FROM rooms WHERE room_id = %s", (room_id,))
-            cursor.execute("DELETE FROM properties WHERE property_id = %s", (property_id,))
-            snowflake_connection.commit()
-            cursor.close()
 
 
 class TestClassificationHistoryPreservation:
@@ -359,18 +256,15 @@ class TestClassificationHistoryPreservation:
     preserved in the classification_history table with its original timestamp.
     """
     
-    @given(
-        prop_data=property_data(),
-        rm_data=room_data(),
-        note_text=text_finding_note()
-    )
-    @settings(max_examples=100)
+    @given(note_text=_NOTE)
     def test_classification_history_preservation(
         self,
-        prop_data,
-        rm_data,
         note_text,
-        snowflake_connection
+        snowflake_connection,
+        ingestion_components,
+        property_room_scaffold,
+        db_savepoint,
+        prepared_cursor
     ):
         """
         **Feature: ai-home-inspection, Property 32: Classification history preservation**
@@ -378,44 +272,30 @@ class TestClassificationHistoryPreservation:
         
         Test that reclassification preserves previous classification in history.
         """
-        # Arrange
-        ingestion = DataIngestion(snowflake_connection)
-        classifier = AIClassification(snowflake_connection)
-        
-        # Create property and room
-        property_id = ingestion.ingest_property(prop_data)
-        room_id = ingestion.ingest_room(rm_data, property_id)
-        
-        # Create text finding
-        finding_id = ingestion.ingest_text_finding(note_text, room_id)
+        # Arrange - property and room come from the module scaffold
+        ingestion, classifier = ingestion_components
+        _, room_id = property_room_scaffold
         
-        # Act - First classification
-        first_tags = classifier.classify_text_finding(finding_id, note_text)
-        
-        # Get the first classification from defect_tags
-        cursor = snowflake_connection.cursor()
-        try:
-            cursor.execute("""
-                SELECT tag_id, defect_category, confidence_score
-                FROM defect_tags
-                WHERE finding_id = %s
-            """, (finding_id,))
-            first_defect_tags = cursor.fetchall()
+        with db_savepoint():
+            # Create text finding
+            finding_id = ingestion.ingest_text_finding(note_text, room_id)
+            
+            # Act - First classification
+            first_tags = classifier.classify_text_finding(finding_id, note_text)
+            assert len(first_tags) > 0, "Classification should always store at least one tag"
+            
+            # Get the first classification from defect_tags
+            first_defect_tags = prepared_cursor.run('tag_summary_v1', (finding_id,)).fetchall()
             assert len(first_defect_tags) > 0, "First classification should create tags"
             
             # Get the first classification from history
-            cursor.execute("""
-                SELECT history_id, defect_category, confidence_score, classification_method
-                FROM classification_history
-                WHERE finding_id = %s
-            """, (finding_id,))
-            first_history = cursor.fetchall()
+            first_history = prepared_cursor.run('history_summary_v1', (finding_id,)).fetchall()
             assert len(first_history) > 0, "First classification should be in history"
             first_history_count = len(first_history)
             
             # Act - Reclassify the finding (simulate manual reclassification)
             # First, delete current defect_tags (but NOT history)
-            cursor.execute("DELETE FROM defect_tags WHERE finding_id = %s", (finding_id,))
+            prepared_cursor.run('delete_tags_v1', (finding_id,))
             snowflake_connection.commit()
             
             # Store a new classification with different method
@@ -428,13 +308,7 @@ class TestClassificationHistoryPreservation:
             )
             
             # Assert - Check that history now has both classifications
-            cursor.execute("""
-                SELECT history_id, defect_category, confidence_score, classification_method
-                FROM classification_history
-                WHERE finding_id = %s
-                ORDER BY classified_at
-            """, (finding_id,))
-            all_history = cursor.fetchall()
+            all_history = prepared_cursor.run('history_summary_ordered_v1', (finding_id,)).fetchall()
             
             assert len(all_history) > first_history_count, \
                 "Reclassification should add to history, not replace it"
@@ -452,23 +326,8 @@ class TestClassificationHistoryPreservation:
                 "New manual classification should be in history"
             
             # Assert - Current defect_tags should only have the new classification
-            cursor.execute("""
-                SELECT defect_category
-                FROM defect_tags
-                WHERE finding_id = %s
-            """, (finding_id,))
-            current_tags = cursor.fetchall()
+            current_tags = prepared_cursor.run('tag_categories_v1', (finding_id,)).fetchall()
             assert len(current_tags) == 1, \
                 "Current tags should only have the new classification"
             assert current_tags[0][0] == new_category, \
                 "Current tag should be the new classification"
-            
-        finally:
-            # Clean up
-            cursor.execute("DELETE FROM defect_tags WHERE finding_id = %s", (finding_id,))
-            cursor.execute("DELETE FROM classification_history WHERE finding_id = %s", (finding_id,))
-            cursor.execute("DELETE FROM findings WHERE finding_id = %s", (finding_id,))
-            cursor.execute("DELETE FROM rooms WHERE room_id = %s", (room_id,))
-            cursor.execute("DELETE FROM properties WHERE property_id = %s", (property_id,))
-            snowflake_connection.commit()
-            cursor.close()
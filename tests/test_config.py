@@ -4,11 +4,12 @@ Includes property-based tests and unit tests for configuration validation
 """
 
 import pytest
+import io
 import os
+import re
 import json
-import tempfile
+import string
 from hypothesis import given, strategies as st, settings
-from pathlib import Path
 
 from src.config import (
     Config, DatabaseConfig, CortexAIConfig, MonitoringConfig,
@@ -27,7 +28,7 @@ def valid_database_config(draw):
     return {
         'account': draw(st.text(min_size=1, max_size=50, alphabet=st.characters(whitelist_categories=('Lu', 'Ll', 'Nd'), whitelist_characters='.-'))),
         'user': draw(st.text(min_size=1, max_size=30, alphabet=st.characters(whitelist_categories=('Lu', 'Ll', 'Nd'), whitelist_characters='_'))),
-        'password': draw(st.text(min_size=8, max_size=50)),
+        'password': draw(st.text(alphabet=string.ascii_letters + string.digits, min_size=8, max_size=50)),
         'warehouse': draw(st.text(min_size=1, max_size=30, alphabet=st.characters(whitelist_categories=('Lu', 'Nd'), whitelist_characters='_'))),
         'database': draw(st.text(min_size=1, max_size=30, alphabet=st.characters(whitelist_categories=('Lu', 'Nd'), whitelist_characters='_'))),
         'schema': draw(st.sampled_from(['PUBLIC', 'PRIVATE', 'STAGING'])),
@@ -52,8 +53,8 @@ def valid_config_dict(draw):
         'monitoring': {
             'metrics_enabled': draw(st.booleans()),
             'log_level': draw(st.sampled_from(['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'])),
-            'alert_email': draw(st.one_of(st.none(), st.emails())),
-            'alert_webhook': draw(st.one_of(st.none(), st.text(min_size=10)))
+            'alert_email': draw(st.one_of(st.none(), st.from_regex(r"[a-z]{3,10}@[a-z]{3,10}\.(com|org|net)", fullmatch=True))),
+            'alert_webhook': draw(st.one_of(st.none(), st.from_regex(r"https://[a-z]{5,20}\.com/[a-z]{5,20}", fullmatch=True)))
         },
         'performance': {
             'batch_size': draw(st.integers(min_value=1, max_value=1000)),
@@ -86,126 +87,80 @@ def test_property_configuration_completeness(config_dict):
     2. All required fields are validated
     3. Configuration can be retrieved after initialization
     """
-    # Create temporary config file
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-        json.dump(config_dict, f)
-        config_file = f.name
-    
-    try:
-        # Load configuration from file
-        config = ConfigLoader.load(config_file)
-        
-        # Verify all required database fields are present
-        assert config.database.account
-        assert config.database.user
-        assert config.database.password
-        assert config.database.warehouse
-        assert config.database.database
-        
-        # Verify environment is valid
-        assert config.environment in ['development', 'staging', 'production']
-        
-        # Verify configuration validates successfully
-        config.validate()  # Should not raise
-        
-        # Verify configuration can be retrieved as masked dict
-        masked = config.get_masked_dict()
-        assert masked['database']['password'] == '***MASKED***'
-        assert masked['database']['account'] == config.database.account
-        
-    finally:
-        # Clean up temp file
-        os.unlink(config_file)
+    # Build configuration directly from the generated dict
+    config = ConfigLoader.from_dict(config_dict)
+    
+    # Verify all required database fields are present
+    assert config.database.account
+    assert config.database.user
+    assert config.database.password
+    assert config.database.warehouse
+    assert config.database.database
+    
+    # Verify environment is valid
+    assert config.environment in ['development', 'staging', 'production']
+    
+    # Verify configuration validates successfully
+    config.validate()  # Should not raise
+    
+    # Verify configuration can be retrieved as masked dict
+    masked = config.get_masked_dict()
+    assert masked['database']['password'] == '***MASKED***'
+    assert masked['database']['account'] == config.database.account
 
 
 # ============================================================================
 # Unit Tests for Configuration Validation
 # ============================================================================
 
+# Required DatabaseConfig fields; blanking any one must fail validation
+BAD_DB_FIELDS = ['account', 'user', 'password', 'warehouse', 'database']
+
+# Expected-error patterns, compiled once for pytest.raises(match=...)
+_RX_MISSING_DB_FIELD = {
+    name: re.compile(f'Missing required database configuration.*{name}')
+    for name in BAD_DB_FIELDS
+}
+_RX_TIMEOUT = re.compile('timeout must be positive')
+_RX_INVALID_LOG_LEVEL = re.compile('Invalid log level')
+_RX_INVALID_ENVIRONMENT = re.compile('Invalid environment')
+_RX_INVALID_JSON = re.compile('Invalid JSON')
+_RX_VALIDATION_FAILED = re.compile('Configuration validation failed')
+
+# (constructor kwargs, expected error pattern) for out-of-range values
+BAD_CORTEX_FIELDS = [
+    ({'timeout_seconds': -1}, _RX_TIMEOUT),
+    ({'timeout_seconds': 0}, _RX_TIMEOUT),
+    ({'retry_count': -1}, re.compile('retry count cannot be negative')),
+]
+_RX_BATCH_SIZE = re.compile('Batch size must be positive')
+BAD_PERFORMANCE_FIELDS = [
+    ({'batch_size': -1}, _RX_BATCH_SIZE),
+    ({'batch_size': 0}, _RX_BATCH_SIZE),
+    ({'max_workers': -1}, re.compile('Max workers must be positive')),
+    ({'cache_ttl_seconds': -1}, re.compile('Cache TTL cannot be negative')),
+    ({'connection_pool_size': 0}, re.compile('Connection pool size must be positive')),
+]
+
+
 class TestDatabaseConfig:
     """Tests for DatabaseConfig validation"""
     
-    def test_valid_database_config(self):
+    def test_valid_database_config(self, valid_db_kwargs):
         """Test that valid database configuration passes validation"""
-        config = DatabaseConfig(
-            account='test-account',
-            user='test_user',
-            password='test_password',
-            warehouse='TEST_WH',
-            database='TEST_DB',
-            schema='PUBLIC'
-        )
+        config = DatabaseConfig(**{**valid_db_kwargs, 'schema': 'PUBLIC'})
         config.validate()  # Should not raise
     
-    def test_missing_account_raises_error(self):
-        """Test that missing account raises ValueError"""
-        config = DatabaseConfig(
-            account='',
-            user='test_user',
-            password='test_password',
-            warehouse='TEST_WH',
-            database='TEST_DB'
-        )
-        with pytest.raises(ValueError, match='Missing required database configuration.*account'):
-            config.validate()
-    
-    def test_missing_user_raises_error(self):
-        """Test that missing user raises ValueError"""
-        config = DatabaseConfig(
-            account='test-account',
-            user='',
-            password='test_password',
-            warehouse='TEST_WH',
-            database='TEST_DB'
-        )
-        with pytest.raises(ValueError, match='Missing required database configuration.*user'):
+    @pytest.mark.parametrize('field', BAD_DB_FIELDS)
+    def test_missing_field_raises_error(self, valid_db_kwargs, field):
+        """Test that a missing required field raises ValueError naming it"""
+        config = DatabaseConfig(**{**valid_db_kwargs, field: ''})
+        with pytest.raises(ValueError, match=_RX_MISSING_DB_FIELD[field]):
             config.validate()
     
-    def test_missing_password_raises_error(self):
-        """Test that missing password raises ValueError"""
-        config = DatabaseConfig(
-            account='test-account',
-            user='test_user',
-            password='',
-            warehouse='TEST_WH',
-            database='TEST_DB'
-        )
-        with pytest.raises(ValueError, match='Missing required database configuration.*password'):
-            config.validate()
-    
-    def test_missing_warehouse_raises_error(self):
-        """Test that missing warehouse raises ValueError"""
-        config = DatabaseConfig(
-            account='test-account',
-            user='test_user',
-            password='test_password',
-            warehouse='',
-            database='TEST_DB'
-        )
-        with pytest.raises(ValueError, match='Missing required database configuration.*warehouse'):
-            config.validate()
-    
-    def test_missing_database_raises_error(self):
-        """Test that missing database raises ValueError"""
-        config = DatabaseConfig(
-            account='test-account',
-            user='test_user',
-            password='test_password',
-            warehouse='TEST_WH',
-            database=''
-        )
-        with pytest.raises(ValueError, match='Missing required database configuration.*database'):
-            config.validate()
-    
-    def test_password_masking(self):
+    def test_password_masking(self, valid_db_kwargs):
         """Test that password is masked in get_masked_dict"""
-        config = DatabaseConfig(
-            account='test-account',
-            user='test_user',
-            password='secret_password_123',
-            warehouse='TEST_WH',
-            database='TEST_DB'
-        )
+        config = DatabaseConfig(**{**valid_db_kwargs, 'password': 'secret_password_123'})
         masked = config.get_masked_dict()
         assert masked['password'] == '***MASKED***'
         assert masked['account'] == 'test-account'
@@ -215,32 +170,25 @@ class TestDatabaseConfig:
 class TestCortexAIConfig:
     """Tests for CortexAIConfig validation"""
     
-    def test_valid_cortex_config(self):
+    def test_valid_cortex_config(self, valid_cortex_kwargs):
         """Test that valid Cortex AI configuration passes validation"""
-        config = CortexAIConfig(
-            enabled=True,
-            timeout_seconds=30,
-            retry_count=3,
-            fallback_enabled=True
-        )
+        config = CortexAIConfig(**valid_cortex_kwargs)
         config.validate()  # Should not raise
     
-    def test_negative_timeout_raises_error(self):
-        """Test that negative timeout raises ValueError"""
-        config = CortexAIConfig(timeout_seconds=-1)
-        with pytest.raises(ValueError, match='timeout must be positive'):
-            config.validate()
-    
-    def test_zero_timeout_raises_error(self):
-        """Test that zero timeout raises ValueError"""
-        config = CortexAIConfig(timeout_seconds=0)
-        with pytest.raises(ValueError, match='timeout must be positive'):
+    @pytest.mark.parametrize('kwargs,message', BAD_CORTEX_FIELDS)
+    def test_invalid_field_raises_error(self, valid_cortex_kwargs, kwargs, message):
+        """Test that out-of-range timeout and retry values raise ValueError"""
+        config = CortexAIConfig(**{**valid_cortex_kwargs, **kwargs})
+        with pytest.raises(ValueError, match=message):
             config.validate()
     
-    def test_negative_retry_count_raises_error(self):
-        """Test that negative retry count raises ValueError"""
-        config = CortexAIConfig(retry_count=-1)
-        with pytest.raises(ValueError, match='retry count cannot be negative'):
+    def test_mutation_after_validation_revalidates(self, valid_cortex_kwargs):
+        """Test that changing a field after a successful validate() validates again"""
+        config = CortexAIConfig(**valid_cortex_kwargs)
+        config.validate()
+        
+        config.timeout_seconds = -1
+        with pytest.raises(ValueError, match=_RX_TIMEOUT):
             config.validate()
 
 
@@ -259,7 +207,7 @@ class TestMonitoringConfig:
     def test_invalid_log_level_raises_error(self):
         """Test that invalid log level raises ValueError"""
         config = MonitoringConfig(log_level='INVALID')
-        with pytest.raises(ValueError, match='Invalid log level'):
+        with pytest.raises(ValueError, match=_RX_INVALID_LOG_LEVEL):
             config.validate()
     
     def test_log_level_case_insensitive(self):
@@ -282,90 +230,64 @@ class TestPerformanceConfig:
         )
         config.validate()  # Should not raise
     
-    def test_negative_batch_size_raises_error(self):
-        """Test that negative batch size raises ValueError"""
-        config = PerformanceConfig(batch_size=-1)
-        with pytest.raises(ValueError, match='Batch size must be positive'):
-            config.validate()
-    
-    def test_zero_batch_size_raises_error(self):
-        """Test that zero batch size raises ValueError"""
-        config = PerformanceConfig(batch_size=0)
-        with pytest.raises(ValueError, match='Batch size must be positive'):
-            config.validate()
-    
-    def test_negative_max_workers_raises_error(self):
-        """Test that negative max workers raises ValueError"""
-        config = PerformanceConfig(max_workers=-1)
-        with pytest.raises(ValueError, match='Max workers must be positive'):
-            config.validate()
-    
-    def test_negative_cache_ttl_raises_error(self):
-        """Test that negative cache TTL raises ValueError"""
-        config = PerformanceConfig(cache_ttl_seconds=-1)
-        with pytest.raises(ValueError, match='Cache TTL cannot be negative'):
-            config.validate()
-    
-    def test_zero_connection_pool_raises_error(self):
-        """Test that zero connection pool size raises ValueError"""
-        config = PerformanceConfig(connection_pool_size=0)
-        with pytest.raises(ValueError, match='Connection pool size must be positive'):
+    @pytest.mark.parametrize('kwargs,message', BAD_PERFORMANCE_FIELDS)
+    def test_invalid_field_raises_error(self, kwargs, message):
+        """Test that out-of-range performance values raise ValueError"""
+        config = PerformanceConfig(**kwargs)
+        with pytest.raises(ValueError, match=message):
             config.validate()
 
 
 class TestConfig:
     """Tests for main Config class"""
     
-    def test_valid_config(self):
+    def test_valid_config(self, valid_db_kwargs):
         """Test that valid complete configuration passes validation"""
         config = Config(
             environment='development',
-            database=DatabaseConfig(
-                account='test-account',
-                user='test_user',
-                password='test_password',
-                warehouse='TEST_WH',
-                database='TEST_DB'
-            )
+            database=DatabaseConfig(**valid_db_kwargs)
         )
         config.validate()  # Should not raise
     
-    def test_invalid_environment_raises_error(self):
+    def test_invalid_environment_raises_error(self, valid_db_kwargs):
         """Test that invalid environment raises ValueError"""
         config = Config(
             environment='invalid',
-            database=DatabaseConfig(
-                account='test-account',
-                user='test_user',
-                password='test_password',
-                warehouse='TEST_WH',
-                database='TEST_DB'
-            )
+            database=DatabaseConfig(**valid_db_kwargs)
         )
-        with pytest.raises(ValueError, match='Invalid environment'):
+        with pytest.raises(ValueError, match=_RX_INVALID_ENVIRONMENT):
             config.validate()
     
-    def test_config_validates_all_sections(self):
+    def test_config_validates_all_sections(self, valid_db_kwargs):
         """Test that config validation checks all sections"""
         config = Config(
             environment='development',
-            database=DatabaseConfig(
-                account='',  # Invalid
-                user='test_user',
-                password='test_password',
-                warehouse='TEST_WH',
-                database='TEST_DB'
-            )
+            database=DatabaseConfig(**{**valid_db_kwargs, 'account': ''})
         )
         with pytest.raises(ValueError):
             config.validate()
 
 
+# Environment applied in one update for the env-loading test
+ENV_BATCH = {
+    'ENVIRONMENT': 'staging',
+    'SNOWFLAKE_ACCOUNT': 'test-account',
+    'SNOWFLAKE_USER': 'test_user',
+    'SNOWFLAKE_PASSWORD': 'test_password',
+    'SNOWFLAKE_WAREHOUSE': 'TEST_WH',
+    'SNOWFLAKE_DATABASE': 'TEST_DB',
+    'LOG_LEVEL': 'DEBUG'
+}
+
+
 class TestConfigLoader:
     """Tests for ConfigLoader"""
     
     def test_load_from_valid_file(self):
         """Test loading configuration from valid JSON file"""
+        # Only the on-disk loader test needs tempfile
+        import tempfile
+        
         config_data = {
             'environment': 'development',
             'database': {
@@ -389,37 +311,92 @@ class TestConfigLoader:
         finally:
             os.unlink(config_file)
     
-    def test_load_from_nonexistent_file_raises_error(self):
-        """Test that loading from nonexistent file raises FileNotFoundError"""
-        with pytest.raises(FileNotFoundError):
-            ConfigLoader.load_from_file('/nonexistent/config.json')
+    def test_load_from_file_rereads_after_modification(self):
+        """Test that a cached config file is re-read once its mtime changes"""
+        import tempfile
+        
+        ConfigLoader.clear_cache()
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            json.dump({'environment': 'development'}, f)
+            config_file = f.name
+        
+        try:
+            assert ConfigLoader.load_from_file(config_file).environment == 'development'
+            assert ConfigLoader.load_from_file(config_file).environment == 'development'
+            
+            with open(config_file, 'w') as f:
+                json.dump({'environment': 'staging'}, f)
+            stat = os.stat(config_file)
+            os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            
+            assert ConfigLoader.load_from_file(config_file).environment == 'staging'
+        finally:
+            os.unlink(config_file)
+            ConfigLoader.clear_cache()
     
-    def test_load_from_invalid_json_raises_error(self):
-        """Test that loading invalid JSON raises ValueError"""
+    def test_load_from_file_rereads_after_same_mtime_rewrite(self):
+        """Test that a rewrite landing on the same mtime is detected by its size"""
+        import tempfile
+        
+        ConfigLoader.clear_cache()
         with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            f.write('{ invalid json }')
+            json.dump({'environment': 'staging'}, f)
             config_file = f.name
         
         try:
-            with pytest.raises(ValueError, match='Invalid JSON'):
-                ConfigLoader.load_from_file(config_file)
+            mtime_ns = os.stat(config_file).st_mtime_ns
+            assert ConfigLoader.load_from_file(config_file).environment == 'staging'
+            
+            with open(config_file, 'w') as f:
+                json.dump({'environment': 'development'}, f)
+            os.utime(config_file, ns=(mtime_ns, mtime_ns))
+            
+            assert ConfigLoader.load_from_file(config_file).environment == 'development'
         finally:
             os.unlink(config_file)
+            ConfigLoader.clear_cache()
     
-    def test_load_from_env_variables(self, monkeypatch):
-        """Test loading configuration from environment variables"""
-        monkeypatch.setenv('ENVIRONMENT', 'staging')
-        monkeypatch.setenv('SNOWFLAKE_ACCOUNT', 'test-account')
-        monkeypatch.setenv('SNOWFLAKE_USER', 'test_user')
-        monkeypatch.setenv('SNOWFLAKE_PASSWORD', 'test_password')
-        monkeypatch.setenv('SNOWFLAKE_WAREHOUSE', 'TEST_WH')
-        monkeypatch.setenv('SNOWFLAKE_DATABASE', 'TEST_DB')
-        monkeypatch.setenv('LOG_LEVEL', 'DEBUG')
+    def test_read_config_file_returns_a_copy(self):
+        """Test that mutating a loaded config dict does not corrupt the cache"""
+        import tempfile
         
-        config = ConfigLoader.load_from_env()
-        assert config.environment == 'staging'
-        assert config.database.account == 'test-account'
-        assert config.monitoring.log_level == 'DEBUG'
+        ConfigLoader.clear_cache()
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            json.dump({'environment': 'staging'}, f)
+            config_file = f.name
+        
+        try:
+            ConfigLoader._read_config_file(config_file)['environment'] = 'invalid'
+            assert ConfigLoader._read_config_file(config_file) == {'environment': 'staging'}
+        finally:
+            os.unlink(config_file)
+            ConfigLoader.clear_cache()
+    
+    def test_load_from_nonexistent_file_raises_error(self):
+        """Test that loading from nonexistent file raises FileNotFoundError"""
+        with pytest.raises(FileNotFoundError):
+            ConfigLoader.load_from_file('/nonexistent/config.json')
+    
+    def test_load_from_invalid_json_raises_error(self):
+        """Test that loading invalid JSON raises ValueError"""
+        with pytest.raises(ValueError, match=_RX_INVALID_JSON):
+            ConfigLoader.load_from_file(io.StringIO('{ invalid json }'))
+    
+    def test_load_from_env_variables(self):
+        """Test loading configuration from environment variables"""
+        saved = {name: os.environ.get(name) for name in ENV_BATCH}
+        os.environ.update(ENV_BATCH)
+        try:
+            config = ConfigLoader.load_from_env()
+            assert config.environment == 'staging'
+            assert config.database.account == 'test-account'
+            assert config.monitoring.log_level == 'DEBUG'
+        finally:
+            for name, value in saved.items():
+                if value is None:
+                    os.environ.pop(name, None)
+                else:
+                    os.environ[name] = value
     
     def test_load_validates_configuration(self):
         """Test that load() validates the configuration"""
@@ -434,70 +411,49 @@ class TestConfigLoader:
             }
         }
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(config_data, f)
-            config_file = f.name
-        
-        try:
-            with pytest.raises(ValueError, match='Configuration validation failed'):
-                ConfigLoader.load(config_file)
-        finally:
-            os.unlink(config_file)
+        with pytest.raises(ValueError, match=_RX_VALIDATION_FAILED):
+            ConfigLoader.load(io.StringIO(json.dumps(config_data)))
+
+
+def _leaves(masked):
+    """Yield every leaf value of a nested masked-config dict as a string"""
+    for value in masked.values():
+        if isinstance(value, dict):
+            yield from _leaves(value)
+        else:
+            yield str(value)
+
+
+@pytest.fixture(scope='module')
+def masked_full_config(valid_db_kwargs):
+    """Masked dict of one Config carrying both a secret password and a secret webhook"""
+    return Config(
+        environment='development',
+        database=DatabaseConfig(**{**valid_db_kwargs, 'password': 'super_secret_password'}),
+        monitoring=MonitoringConfig(
+            alert_webhook='https://hooks.slack.com/services/SECRET/TOKEN/HERE'
+        )
+    ).get_masked_dict()
 
 
 class TestCredentialMasking:
     """Tests for credential masking in error messages"""
     
-    def test_password_not_in_masked_dict(self):
+    def test_password_not_in_masked_dict(self, masked_full_config):
         """Test that password is masked in configuration dictionary"""
-        config = Config(
-            environment='development',
-            database=DatabaseConfig(
-                account='test-account',
-                user='test_user',
-                password='super_secret_password',
-                warehouse='TEST_WH',
-                database='TEST_DB'
-            )
-        )
-        
-        masked = config.get_masked_dict()
-        
         # Password should be masked
-        assert 'super_secret_password' not in str(masked)
-        assert masked['database']['password'] == '***MASKED***'
+        assert not any('super_secret_password' in leaf for leaf in _leaves(masked_full_config))
+        assert masked_full_config['database']['password'] == '***MASKED***'
     
-    def test_webhook_masked_in_dict(self):
+    def test_webhook_masked_in_dict(self, masked_full_config):
         """Test that webhook URL is masked in configuration dictionary"""
-        config = Config(
-            environment='development',
-            database=DatabaseConfig(
-                account='test-account',
-                user='test_user',
-                password='test_password',
-                warehouse='TEST_WH',
-                database='TEST_DB'
-            ),
-            monitoring=MonitoringConfig(
-                alert_webhook='https://hooks.slack.com/services/SECRET/TOKEN/HERE'
-            )
-        )
-        
-        masked = config.get_masked_dict()
-        
         # Webhook should be masked
-        assert 'SECRET' not in str(masked)
-        assert masked['monitoring']['alert_webhook'] == '***MASKED***'
+        assert not any('SECRET' in leaf for leaf in _leaves(masked_full_config))
+        assert masked_full_config['monitoring']['alert_webhook'] == '***MASKED***'
     
-    def test_validation_error_does_not_expose_password(self):
+    def test_validation_error_does_not_expose_password(self, valid_db_kwargs):
         """Test that validation errors don't expose passwords"""
-        config = DatabaseConfig(
-            account='',
-            user='test_user',
-            password='super_secret_password_123',
-            warehouse='TEST_WH',
-            database='TEST_DB'
-        )
+        config = DatabaseConfig(**{**valid_db_kwargs, 'account': '', 'password': 'super_secret_password_123'})
         
         try:
             config.validate()
@@ -4,7 +4,7 @@ Tests core functionality without requiring Streamlit runtime
 """
 
 import pytest
-from src.dashboard_app import sanitize_error_message, get_risk_color, format_date
+from src.error_sanitizer import sanitize_error_message, get_risk_color, format_date
 from datetime import date
 
 
@@ -4,26 +4,56 @@ Feature: ai-home-inspection
 """
 
 import pytest
-from hypothesis import given, strategies as st, settings, assume
+from hypothesis import given, example, strategies as st
 from datetime import date, timedelta
-import sys
-import os
 import uuid
-
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+import itertools
 
 from dashboard_data import DashboardData
-from data_ingestion import DataIngestion
 from ai_classification import AIClassification
-from risk_scoring import RiskScoring
+
+
+# Every property these tests create starts with this prefix, so the rows can be
+# purged in one statement per table on a real connection
+TEST_ID_PREFIX = 'test_'
+
+
+@pytest.fixture(scope="module", autouse=True)
+def purge_test_properties(snowflake_connection):
+    """
+    Remove every test-prefixed property and its dependents after the module.
+    
+    Each example runs inside db_savepoint, which rolls the mock back in O(1).
+    Snowflake has no savepoints, so against a real connection the rows are left
+    in place until this single teardown sweep.
+    """
+    yield
+    if getattr(snowflake_connection, '_is_mock', False) is True:
+        return
+    
+    pattern = TEST_ID_PREFIX.replace('_', '\\_') + '%'
+    property_filter = "SELECT property_id FROM properties WHERE property_id LIKE %s"
+    room_filter = f"SELECT room_id FROM rooms WHERE property_id IN ({property_filter})"
+    finding_filter = f"SELECT finding_id FROM findings WHERE room_id IN ({room_filter})"
+    cursor = snowflake_connection.cursor()
+    try:
+        for table in ('defect_tags', 'classification_history'):
+            cursor.execute(
+                f"DELETE FROM {table} WHERE finding_id IN ({finding_filter})", (pattern,)
+            )
+        cursor.execute(f"DELETE FROM findings WHERE room_id IN ({room_filter})", (pattern,))
+        cursor.execute(f"DELETE FROM rooms WHERE property_id IN ({property_filter})", (pattern,))
+        cursor.execute("DELETE FROM properties WHERE property_id LIKE %s", (pattern,))
+        snowflake_connection.commit()
+    finally:
+        cursor.close()
 
 
 # Test data generators
 @st.composite
 def property_data(draw):
     """Generate valid property data for testing"""
-    property_id = draw(st.uuids()).hex
+    property_id = TEST_ID_PREFIX + draw(st.uuids()).hex
     location = draw(st.text(
         alphabet=st.characters(whitelist_categories=('Lu', 'Ll', 'Nd', 'Zs', 'Pd')),
         min_size=1,
@@ -72,10 +102,67 @@ def defect_category(draw):
     ]))
 
 
+@st.composite
+def real_defect_category(draw):
+    """Generate a defect category that names an actual defect (never 'none')"""
+    return draw(st.sampled_from([
+        'damp wall', 'exposed wiring', 'crack', 'mold', 'water leak'
+    ]))
+
+
+@st.composite
+def search_case(draw):
+    """
+    Generate (search_term, prop_without_term) where the property's location and
+    identifier do not contain the term, so no example has to be rejected later
+    """
+    search_term = draw(st.text(
+        alphabet=st.characters(whitelist_categories=('Lu', 'Ll', 'Nd')),
+        min_size=2,
+        max_size=10
+    ))
+    term = search_term.lower()
+    prop_without_term = draw(property_data().filter(
+        lambda p: term not in p['location'].lower() and term not in p['property_id'].lower()
+    ))
+    return search_term, prop_without_term
+
+
 @st.composite
 def risk_category(draw):
     """Generate valid risk category"""
-    return draw(st.sampled_from(['Low', 'Medium', 'High']))
+    return draw(st.sampled_from(RISK_CATEGORIES))
+
+
+# Data-independent lookups shared by the filter tests
+RISK_CATEGORIES = ('Low', 'Medium', 'High')
+
+# Representative score for each category (Low < 5, Medium 5-9, High >= 10)
+RISK_SCORES = {'Low': 2, 'Medium': 7, 'High': 12}
+
+OTHER_RISKS = {
+    risk: [r for r in RISK_CATEGORIES if r != risk]
+    for risk in RISK_CATEGORIES
+}
+
+# Some defect category other than each one ('none' maps to the first real category)
+OTHER_DEFECTS = {
+    defect: next((d for d in AIClassification.TEXT_DEFECT_CATEGORIES if d != defect), 'none')
+    for defect in AIClassification.TEXT_DEFECT_CATEGORIES + ['none']
+}
+
+
+def _ids_matching_search(properties, search_term):
+    """
+    Return the ids of the generated properties whose location or identifier
+    contains search_term, case-insensitively (generated properties have no
+    summary text).
+    """
+    term = search_term.lower()
+    return {
+        p['property_id'] for p in properties
+        if term in p['location'].lower() or term in p['property_id'].lower()
+    }
 
 
 class TestDashboardDisplaysAllProperties:
@@ -86,52 +173,82 @@ class TestDashboardDisplaysAllProperties:
     should include all of them when no filters are applied.
     """
     
-    @given(properties=st.lists(property_data(), min_size=1, max_size=10, unique_by=lambda p: p['property_id']))
-    @settings(max_examples=100)
-    def test_dashboard_displays_all_properties(self, properties, snowflake_connection):
+    @given(properties=st.lists(property_data(), min_size=50, max_size=200, unique_by=lambda p: p['property_id']))
+    def test_invariants_over_corpus(self, properties, db_savepoint, ingestion, dashboard):
         """
         **Feature: ai-home-inspection, Property 14: Dashboard displays all properties**
         **Validates: Requirements 6.1**
         
-        Test that the dashboard displays all properties when no filters are applied.
+        Test that the dashboard displays every property of a whole corpus when no
+        filters are applied. The corpus is stored with one bulk insert and read
+        back with one query, then each property is checked in Python.
         """
-        # Arrange
-        ingestion = DataIngestion(snowflake_connection)
-        dashboard = DashboardData(snowflake_connection)
-        
-        # Store all properties
-        stored_ids = []
-        for prop_data in properties:
-            stored_id = ingestion.ingest_property(prop_data)
-            stored_ids.append(stored_id)
-        
-        try:
-            # Act - Get property list with no filters
-            result = dashboard.get_property_list()
+        with db_savepoint():
+            # Arrange - Store the whole corpus
+            stored_ids = ingestion.ingest_properties_bulk(properties)
             
-            # Assert - All stored properties should be in the result
-            result_ids = {p['property_id'] for p in result}
-            expected_ids = {p['property_id'] for p in properties}
+            # Act - Get property list with no other filters, scoped to the stored ids
+            result = dashboard.get_property_list_columnar(property_ids=stored_ids)
             
-            assert expected_ids.issubset(result_ids), \
-                f"All stored properties should be in the result. Expected {expected_ids}, got {result_ids}"
+            # Assert - Every property should appear exactly once
+            row_by_id = {prop_id: i for i, prop_id in enumerate(result['property_id'])}
+            assert len(row_by_id) == len(result['property_id']), \
+                "Each property should appear exactly once in results"
             
-            # Verify each property is present
+            missing = {p['property_id'] for p in properties} - row_by_id.keys()
+            assert not missing, \
+                f"All stored properties should be in the result, missing {missing}"
+            
+            # Assert - Each property should come back with its stored values
             for prop_data in properties:
-                matching = [p for p in result if p['property_id'] == prop_data['property_id']]
-                assert len(matching) == 1, \
-                    f"Property {prop_data['property_id']} should appear exactly once in results"
-        
-        finally:
-            # Clean up
-            cursor = snowflake_connection.cursor()
-            try:
-                for prop_id in stored_ids:
-                    cursor.execute("DELETE FROM properties WHERE property_id = %s", (prop_id,))
-                snowflake_connection.commit()
-            finally:
-                cursor.close()
+                i = row_by_id[prop_data['property_id']]
+                assert result['location'][i] == prop_data['location'], \
+                    f"Property {prop_data['property_id']} location must match stored value"
+                assert result['inspection_date'][i] == prop_data['inspection_date'], \
+                    f"Property {prop_data['property_id']} inspection_date must match stored value"
+
 
+# Locations of the properties seeded once for the required-fields checks
+SEEDED_LOCATIONS = (
+    '12 Oak Street', 'Flat 3, Mill Lane', 'Riverside Cottage',
+    'Unit 7-B Harbour View', 'Ashdown Farm'
+)
+
+
+@pytest.fixture(scope="class")
+def seeded_properties(snowflake_connection, ingestion, risk_scoring):
+    """
+    Ingest a fixed set of properties and compute their risk scores once per class.
+    
+    Examples only choose which seeded property to check, so the rows are
+    written a single time instead of being re-seeded for every example.
+    """
+    
+    properties = [
+        {
+            'property_id': f"{TEST_ID_PREFIX}seeded_{uuid.uuid4().hex}",
+            'location': location,
+            'inspection_date': date(2020, 1, 1) + timedelta(days=offset)
+        }
+        for offset, location in enumerate(SEEDED_LOCATIONS)
+    ]
+    stored_ids = ingestion.ingest_properties_bulk(properties)
+    for stored_id in stored_ids:
+        # Compute risk score (will be 0 if no defects, but that's ok)
+        risk_scoring.compute_property_risk(stored_id)
+    
+    yield properties
+    
+    cursor = snowflake_connection.cursor()
+    try:
+        placeholders = ', '.join(['%s'] * len(stored_ids))
+        cursor.execute(
+            f"DELETE FROM properties WHERE property_id IN ({placeholders})",
+            tuple(stored_ids)
+        )
+        snowflake_connection.commit()
+    finally:
+        cursor.close()
 
 
 class TestPropertyListRequiredFields:
@@ -142,9 +259,8 @@ class TestPropertyListRequiredFields:
     property identifier, location, inspection date, risk category, and risk score.
     """
     
-    @given(properties=st.lists(property_data(), min_size=1, max_size=5, unique_by=lambda p: p['property_id']))
-    @settings(max_examples=100)
-    def test_property_list_contains_required_fields(self, properties, snowflake_connection):
+    @given(focus=st.integers(min_value=0, max_value=len(SEEDED_LOCATIONS) - 1))
+    def test_property_list_contains_required_fields(self, focus, seeded_properties, dashboard):
         """
         **Feature: ai-home-inspection, Property 15: Property list contains required fields**
         **Validates: Requirements 6.2**
@@ -152,66 +268,44 @@ class TestPropertyListRequiredFields:
         Test that each property in the list contains all required fields.
         """
         # Arrange
-        ingestion = DataIngestion(snowflake_connection)
-        dashboard = DashboardData(snowflake_connection)
-        risk_scoring = RiskScoring(snowflake_connection)
+        prop_data = seeded_properties[focus]
         
-        # Store all properties and compute risk scores
-        stored_ids = []
-        for prop_data in properties:
-            stored_id = ingestion.ingest_property(prop_data)
-            stored_ids.append(stored_id)
-            # Compute risk score (will be 0 if no defects, but that's ok)
-            risk_scoring.compute_property_risk(stored_id)
+        # Act - Get property list
+        result = dashboard.get_property_list()
         
-        try:
-            # Act - Get property list
-            result = dashboard.get_property_list()
-            
-            # Assert - Each property should have all required fields
-            for prop_data in properties:
-                matching = [p for p in result if p['property_id'] == prop_data['property_id']]
-                assert len(matching) == 1, \
-                    f"Property {prop_data['property_id']} should appear exactly once"
-                
-                prop_result = matching[0]
-                
-                # Check all required fields are present and not None
-                assert 'property_id' in prop_result, "property_id field must be present"
-                assert prop_result['property_id'] is not None, "property_id must not be None"
-                assert prop_result['property_id'] == prop_data['property_id'], \
-                    "property_id must match stored value"
-                
-                assert 'location' in prop_result, "location field must be present"
-                assert prop_result['location'] is not None, "location must not be None"
-                assert prop_result['location'] == prop_data['location'], \
-                    "location must match stored value"
-                
-                assert 'inspection_date' in prop_result, "inspection_date field must be present"
-                assert prop_result['inspection_date'] is not None, "inspection_date must not be None"
-                assert prop_result['inspection_date'] == prop_data['inspection_date'], \
-                    "inspection_date must match stored value"
-                
-                assert 'risk_category' in prop_result, "risk_category field must be present"
-                assert prop_result['risk_category'] is not None, "risk_category must not be None"
-                assert prop_result['risk_category'] in ['Low', 'Medium', 'High'], \
-                    "risk_category must be a valid category"
-                
-                assert 'risk_score' in prop_result, "risk_score field must be present"
-                assert prop_result['risk_score'] is not None, "risk_score must not be None"
-                assert isinstance(prop_result['risk_score'], int), \
-                    "risk_score must be an integer"
+        # Assert - The focused property should have all required fields
+        by_id = {p['property_id']: p for p in result}
+        assert len(by_id) == len(result), "Each property should appear exactly once"
+        assert prop_data['property_id'] in by_id, \
+            f"Property {prop_data['property_id']} should be in the list"
         
-        finally:
-            # Clean up
-            cursor = snowflake_connection.cursor()
-            try:
-                for prop_id in stored_ids:
-                    cursor.execute("DELETE FROM properties WHERE property_id = %s", (prop_id,))
-                snowflake_connection.commit()
-            finally:
-                cursor.close()
-
+        prop_result = by_id[prop_data['property_id']]
+        
+        # Check all required fields are present and not None
+        assert 'property_id' in prop_result, "property_id field must be present"
+        assert prop_result['property_id'] is not None, "property_id must not be None"
+        assert prop_result['property_id'] == prop_data['property_id'], \
+            "property_id must match stored value"
+        
+        assert 'location' in prop_result, "location field must be present"
+        assert prop_result['location'] is not None, "location must not be None"
+        assert prop_result['location'] == prop_data['location'], \
+            "location must match stored value"
+        
+        assert 'inspection_date' in prop_result, "inspection_date field must be present"
+        assert prop_result['inspection_date'] is not None, "inspection_date must not be None"
+        assert prop_result['inspection_date'] == prop_data['inspection_date'], \
+            "inspection_date must match stored value"
+        
+        assert 'risk_category' in prop_result, "risk_category field must be present"
+        assert prop_result['risk_category'] is not None, "risk_category must not be None"
+        assert prop_result['risk_category'] in ['Low', 'Medium', 'High'], \
+            "risk_category must be a valid category"
+        
+        assert 'risk_score' in prop_result, "risk_score field must be present"
+        assert prop_result['risk_score'] is not None, "risk_score must not be None"
+        assert isinstance(prop_result['risk_score'], int), \
+            "risk_score must be an integer"
 
 
 class TestDetailViewCompleteness:
@@ -227,37 +321,37 @@ class TestDetailViewCompleteness:
         rooms=st.lists(room_data(), min_size=1, max_size=3, unique_by=lambda r: r['room_id']),
         defect_cat=defect_category()
     )
-    @settings(max_examples=100)
-    def test_detail_view_shows_complete_data(self, prop_data, rooms, defect_cat, snowflake_connection):
+    def test_detail_view_shows_complete_data(self, prop_data, rooms, defect_cat, snowflake_connection, db_savepoint, cursor, ingestion, dashboard):
         """
         **Feature: ai-home-inspection, Property 16: Detail view shows complete data**
         **Validates: Requirements 6.3**
         
         Test that property detail view includes all rooms, findings, and defect tags.
         """
-        # Arrange
-        ingestion = DataIngestion(snowflake_connection)
-        classification = AIClassification(snowflake_connection)
-        dashboard = DashboardData(snowflake_connection)
-        
-        # Store property
-        property_id = ingestion.ingest_property(prop_data)
-        
-        # Store rooms and findings
-        room_ids = []
-        finding_ids = []
-        for room in rooms:
-            room_id = ingestion.ingest_room(room, property_id)
-            room_ids.append(room_id)
-            
-            # Add a text finding to each room
-            finding_id = ingestion.ingest_text_finding(f"Test finding with {defect_cat}", room_id)
-            finding_ids.append(finding_id)
-            
-            # Classify the finding
-            classification.classify_text_finding(finding_id, f"Test finding with {defect_cat}")
-        
-        try:
+        with db_savepoint():
+            # Arrange - Store property
+            property_id = ingestion.ingest_property(prop_data)
+            
+            # Store rooms and one text finding per room in a single batch
+            note = f"Test finding with {defect_cat}"
+            stored = ingestion.ingest_rooms_with_findings(
+                [(room, [note]) for room in rooms], property_id
+            )
+            
+            # Tag every finding directly; only the defect_tags rows matter here
+            severity = AIClassification.SEVERITY_WEIGHTS.get(defect_cat, 0)
+            tag_rows = [
+                (str(uuid.uuid4()), finding_id, defect_cat, 0.9, severity)
+                for _, finding_ids in stored
+                for finding_id in finding_ids
+            ]
+            cursor.executemany("""
+                INSERT INTO defect_tags (tag_id, finding_id, defect_category, 
+                                       confidence_score, severity_weight)
+                VALUES (%s, %s, %s, %s, %s)
+            """, tag_rows)
+            snowflake_connection.commit()
+            
             # Act - Get property details
             result = dashboard.get_property_details(property_id)
             
@@ -297,23 +391,53 @@ class TestDetailViewCompleteness:
                         assert 'defect_category' in tag
                         assert 'confidence_score' in tag
                         assert 'severity_weight' in tag
-        
-        finally:
-            # Clean up
-            cursor = snowflake_connection.cursor()
-            try:
-                for finding_id in finding_ids:
-                    cursor.execute("DELETE FROM defect_tags WHERE finding_id = %s", (finding_id,))
-                    cursor.execute("DELETE FROM classification_history WHERE finding_id = %s", (finding_id,))
-                    cursor.execute("DELETE FROM findings WHERE finding_id = %s", (finding_id,))
-                for room_id in room_ids:
-                    cursor.execute("DELETE FROM rooms WHERE room_id = %s", (room_id,))
-                cursor.execute("DELETE FROM properties WHERE property_id = %s", (property_id,))
-                snowflake_connection.commit()
-            finally:
-                cursor.close()
 
 
+@pytest.fixture(scope="class")
+def risk_seeded_properties(snowflake_connection):
+    """
+    Ingest a few properties per risk category once per class and yield
+    {risk_category: [property_id, ...]}.
+    
+    The table is not touched again while the class runs, so repeated
+    get_property_list(risk_level=...) queries can be served from Snowflake's
+    result cache.
+    """
+    seeded = {
+        risk: [f"{TEST_ID_PREFIX}{risk.lower()}_{uuid.uuid4().hex}" for _ in range(2)]
+        for risk in RISK_CATEGORIES
+    }
+    stored_ids = [prop_id for prop_ids in seeded.values() for prop_id in prop_ids]
+    
+    # Insert the properties together with their risk columns in one statement
+    cursor = snowflake_connection.cursor()
+    try:
+        cursor.executemany("""
+            INSERT INTO properties (property_id, location, inspection_date,
+                                    risk_score, risk_category)
+            VALUES (%s, %s, %s, %s, %s)
+        """, [
+            (prop_id, f"{risk} risk property", date(2020, 1, 1), RISK_SCORES[risk], risk)
+            for risk, prop_ids in seeded.items()
+            for prop_id in prop_ids
+        ])
+        snowflake_connection.commit()
+    finally:
+        cursor.close()
+    
+    yield seeded
+    
+    cursor = snowflake_connection.cursor()
+    try:
+        placeholders = ', '.join(['%s'] * len(stored_ids))
+        cursor.execute(
+            f"DELETE FROM properties WHERE property_id IN ({placeholders})",
+            tuple(stored_ids)
+        )
+        snowflake_connection.commit()
+    finally:
+        cursor.close()
+
 
 class TestRiskLevelFiltering:
     """
@@ -323,107 +447,41 @@ class TestRiskLevelFiltering:
     that risk category, and no properties with that category should be excluded.
     """
     
-    @given(
-        target_risk=risk_category(),
-        properties_with_target=st.lists(property_data(), min_size=1, max_size=3, unique_by=lambda p: p['property_id']),
-        properties_without_target=st.lists(property_data(), min_size=1, max_size=3, unique_by=lambda p: p['property_id'])
-    )
-    @settings(max_examples=100)
-    def test_risk_level_filtering_correctness(self, target_risk, properties_with_target, 
-                                              properties_without_target, snowflake_connection):
+    @pytest.mark.parametrize('target_risk', RISK_CATEGORIES)
+    def test_risk_level_filtering_correctness(self, target_risk, risk_seeded_properties, dashboard):
         """
         **Feature: ai-home-inspection, Property 17: Risk level filtering correctness**
         **Validates: Requirements 7.1**
         
         Test that risk level filtering returns only properties with the specified risk category.
         """
-        # Ensure no overlap between the two property sets
-        all_ids = [p['property_id'] for p in properties_with_target + properties_without_target]
-        assume(len(all_ids) == len(set(all_ids)))
-        
         # Arrange
-        ingestion = DataIngestion(snowflake_connection)
-        risk_scoring = RiskScoring(snowflake_connection)
-        dashboard = DashboardData(snowflake_connection)
-        
-        # Map risk categories to scores
-        risk_scores = {
-            'Low': 2,    # < 5
-            'Medium': 7,  # 5-9
-            'High': 12   # >= 10
+        expected_ids = set(risk_seeded_properties[target_risk])
+        other_ids_set = {
+            prop_id
+            for other_risk in OTHER_RISKS[target_risk]
+            for prop_id in risk_seeded_properties[other_risk]
         }
         
-        # Determine other risk categories
-        other_risks = [r for r in ['Low', 'Medium', 'High'] if r != target_risk]
+        # Act - Filter by target risk level
+        result = dashboard.get_property_list(risk_level=target_risk)
         
-        # Store properties with target risk
-        target_ids = []
-        for prop_data in properties_with_target:
-            prop_id = ingestion.ingest_property(prop_data)
-            target_ids.append(prop_id)
-            # Manually set the risk score and category
-            cursor = snowflake_connection.cursor()
-            try:
-                cursor.execute("""
-                    UPDATE properties
-                    SET risk_score = %s, risk_category = %s
-                    WHERE property_id = %s
-                """, (risk_scores[target_risk], target_risk, prop_id))
-                snowflake_connection.commit()
-            finally:
-                cursor.close()
+        # Assert - All returned properties should have target risk
+        result_ids = {p['property_id'] for p in result}
         
-        # Store properties without target risk
-        other_ids = []
-        for i, prop_data in enumerate(properties_without_target):
-            prop_id = ingestion.ingest_property(prop_data)
-            other_ids.append(prop_id)
-            # Assign a different risk category
-            other_risk = other_risks[i % len(other_risks)]
-            cursor = snowflake_connection.cursor()
-            try:
-                cursor.execute("""
-                    UPDATE properties
-                    SET risk_score = %s, risk_category = %s
-                    WHERE property_id = %s
-                """, (risk_scores[other_risk], other_risk, prop_id))
-                snowflake_connection.commit()
-            finally:
-                cursor.close()
+        # All target properties should be in results
+        assert expected_ids.issubset(result_ids), \
+            f"All properties with {target_risk} risk should be returned"
         
-        try:
-            # Act - Filter by target risk level
-            result = dashboard.get_property_list(risk_level=target_risk)
-            
-            # Assert - All returned properties should have target risk
-            result_ids = {p['property_id'] for p in result}
-            expected_ids = {p['property_id'] for p in properties_with_target}
-            
-            # All target properties should be in results
-            assert expected_ids.issubset(result_ids), \
-                f"All properties with {target_risk} risk should be returned"
-            
-            # No other properties should be in results
-            other_ids_set = set(other_ids)
-            assert result_ids.isdisjoint(other_ids_set), \
-                f"Properties without {target_risk} risk should not be returned"
-            
-            # All results should have the target risk category
-            for prop in result:
-                if prop['property_id'] in expected_ids:
-                    assert prop['risk_category'] == target_risk, \
-                        f"Property {prop['property_id']} should have risk category {target_risk}"
+        # No other properties should be in results
+        assert result_ids.isdisjoint(other_ids_set), \
+            f"Properties without {target_risk} risk should not be returned"
         
-        finally:
-            # Clean up
-            cursor = snowflake_connection.cursor()
-            try:
-                for prop_id in target_ids + other_ids:
-                    cursor.execute("DELETE FROM properties WHERE property_id = %s", (prop_id,))
-                snowflake_connection.commit()
-            finally:
-                cursor.close()
-
+        # All results should have the target risk category
+        for prop in result:
+            if prop['property_id'] in expected_ids:
+                assert prop['risk_category'] == target_risk, \
+                    f"Property {prop['property_id']} should have risk category {target_risk}"
 
 
 class TestDefectTypeFiltering:
@@ -435,74 +493,52 @@ class TestDefectTypeFiltering:
     """
     
     @given(
-        target_defect=defect_category(),
+        target_defect=real_defect_category(),
         prop_with_defect=property_data(),
         prop_without_defect=property_data(),
         room_with=room_data(),
         room_without=room_data()
     )
-    @settings(max_examples=100)
     def test_defect_type_filtering_correctness(self, target_defect, prop_with_defect, 
                                                prop_without_defect, room_with, room_without,
-                                               snowflake_connection):
+                                               snowflake_connection, db_savepoint, cursor, ingestion, dashboard):
         """
         **Feature: ai-home-inspection, Property 18: Defect type filtering correctness**
         **Validates: Requirements 7.2**
         
         Test that defect type filtering returns only properties with the specified defect.
         """
-        # Ensure properties are different
-        assume(prop_with_defect['property_id'] != prop_without_defect['property_id'])
-        assume(room_with['room_id'] != room_without['room_id'])
-        assume(target_defect != 'none')  # Skip 'none' as it's not a real defect
-        
-        # Arrange
-        ingestion = DataIngestion(snowflake_connection)
-        classification = AIClassification(snowflake_connection)
-        dashboard = DashboardData(snowflake_connection)
-        
-        # Store property with target defect
-        prop_with_id = ingestion.ingest_property(prop_with_defect)
-        room_with_id = ingestion.ingest_room(room_with, prop_with_id)
-        finding_with_id = ingestion.ingest_text_finding(f"Finding with {target_defect}", room_with_id)
-        
-        # Manually create defect tag with target defect
-        import uuid
-        tag_id = str(uuid.uuid4())
-        cursor = snowflake_connection.cursor()
-        try:
+        with db_savepoint():
+            # Arrange - Store property with target defect
+            prop_with_id = ingestion.ingest_property(prop_with_defect)
+            room_with_id = ingestion.ingest_room(room_with, prop_with_id)
+            finding_with_id = ingestion.ingest_text_finding(f"Finding with {target_defect}", room_with_id)
+            
+            # Manually create defect tag with target defect
+            tag_id = str(uuid.uuid4())
             cursor.execute("""
                 INSERT INTO defect_tags (tag_id, finding_id, defect_category, 
                                        confidence_score, severity_weight)
                 VALUES (%s, %s, %s, %s, %s)
             """, (tag_id, finding_with_id, target_defect, 0.9, 
-                  classification.SEVERITY_WEIGHTS.get(target_defect, 0)))
-            snowflake_connection.commit()
-        finally:
-            cursor.close()
-        
-        # Store property without target defect
-        prop_without_id = ingestion.ingest_property(prop_without_defect)
-        room_without_id = ingestion.ingest_room(room_without, prop_without_id)
-        finding_without_id = ingestion.ingest_text_finding("Finding with no defects", room_without_id)
-        
-        # Give it a different defect (or 'none')
-        other_defects = [d for d in classification.TEXT_DEFECT_CATEGORIES if d != target_defect]
-        other_defect = other_defects[0] if other_defects else 'none'
-        tag_id_2 = str(uuid.uuid4())
-        cursor = snowflake_connection.cursor()
-        try:
+                  AIClassification.SEVERITY_WEIGHTS.get(target_defect, 0)))
+            
+            # Store property without target defect
+            prop_without_id = ingestion.ingest_property(prop_without_defect)
+            room_without_id = ingestion.ingest_room(room_without, prop_without_id)
+            finding_without_id = ingestion.ingest_text_finding("Finding with no defects", room_without_id)
+            
+            # Give it a different defect (or 'none')
+            other_defect = OTHER_DEFECTS[target_defect]
+            tag_id_2 = str(uuid.uuid4())
             cursor.execute("""
                 INSERT INTO defect_tags (tag_id, finding_id, defect_category, 
                                        confidence_score, severity_weight)
                 VALUES (%s, %s, %s, %s, %s)
             """, (tag_id_2, finding_without_id, other_defect, 0.9,
-                  classification.SEVERITY_WEIGHTS.get(other_defect, 0)))
+                  AIClassification.SEVERITY_WEIGHTS.get(other_defect, 0)))
             snowflake_connection.commit()
-        finally:
-            cursor.close()
-        
-        try:
+            
             # Act - Filter by target defect type
             result = dashboard.get_property_list(defect_type=target_defect)
             
@@ -514,23 +550,6 @@ class TestDefectTypeFiltering:
             # Assert - Property without target defect should not be in results
             assert prop_without_id not in result_ids, \
                 f"Property without {target_defect} should not be in results"
-        
-        finally:
-            # Clean up
-            cursor = snowflake_connection.cursor()
-            try:
-                cursor.execute("DELETE FROM defect_tags WHERE finding_id IN (%s, %s)", 
-                             (finding_with_id, finding_without_id))
-                cursor.execute("DELETE FROM findings WHERE finding_id IN (%s, %s)", 
-                             (finding_with_id, finding_without_id))
-                cursor.execute("DELETE FROM rooms WHERE room_id IN (%s, %s)", 
-                             (room_with_id, room_without_id))
-                cursor.execute("DELETE FROM properties WHERE property_id IN (%s, %s)", 
-                             (prop_with_id, prop_without_id))
-                snowflake_connection.commit()
-            finally:
-                cursor.close()
-
 
 
 class TestSearchMatching:
@@ -541,41 +560,24 @@ class TestSearchMatching:
     location, identifier, or summary text.
     """
     
-    @given(
-        search_term=st.text(
-            alphabet=st.characters(whitelist_categories=('Lu', 'Ll', 'Nd')),
-            min_size=2,
-            max_size=10
-        ),
-        prop_with_term=property_data(),
-        prop_without_term=property_data()
-    )
-    @settings(max_examples=100)
-    def test_search_term_matching(self, search_term, prop_with_term, prop_without_term, snowflake_connection):
+    @given(case=search_case(), prop_with_term=property_data())
+    def test_search_term_matching(self, case, prop_with_term, db_savepoint, ingestion, dashboard):
         """
         **Feature: ai-home-inspection, Property 19: Search term matching**
         **Validates: Requirements 7.3**
         
         Test that search returns only properties containing the search term.
         """
-        # Ensure properties are different
-        assume(prop_with_term['property_id'] != prop_without_term['property_id'])
-        # Ensure search term is not in the second property's data
-        assume(search_term.lower() not in prop_without_term['location'].lower())
-        assume(search_term.lower() not in prop_without_term['property_id'].lower())
-        
-        # Arrange
-        ingestion = DataIngestion(snowflake_connection)
-        dashboard = DashboardData(snowflake_connection)
-        
-        # Modify first property to include search term in location
-        prop_with_term['location'] = f"Building with {search_term} in name"
-        
-        # Store both properties
-        prop_with_id = ingestion.ingest_property(prop_with_term)
-        prop_without_id = ingestion.ingest_property(prop_without_term)
+        search_term, prop_without_term = case
         
-        try:
+        with db_savepoint():
+            # Arrange - Modify first property to include search term in location
+            prop_with_term['location'] = f"Building with {search_term} in name"
+            
+            # Store both properties
+            prop_with_id = ingestion.ingest_property(prop_with_term)
+            prop_without_id = ingestion.ingest_property(prop_without_term)
+            
             # Act - Search for the term
             result = dashboard.get_property_list(search_term=search_term)
             
@@ -588,26 +590,12 @@ class TestSearchMatching:
             assert prop_without_id not in result_ids, \
                 f"Property without search term '{search_term}' should not be in results"
             
-            # Assert - All results should contain the search term
-            for prop in result:
-                if prop['property_id'] in {prop_with_id, prop_without_id}:
-                    location_match = search_term.lower() in (prop['location'] or '').lower()
-                    id_match = search_term.lower() in (prop['property_id'] or '').lower()
-                    summary_match = search_term.lower() in (prop['summary_text'] or '').lower()
-                    
-                    assert location_match or id_match or summary_match, \
-                        f"Property {prop['property_id']} should contain search term '{search_term}'"
-        
-        finally:
-            # Clean up
-            cursor = snowflake_connection.cursor()
-            try:
-                cursor.execute("DELETE FROM properties WHERE property_id IN (%s, %s)", 
-                             (prop_with_id, prop_without_id))
-                snowflake_connection.commit()
-            finally:
-                cursor.close()
-
+            # Assert - Of the stored properties, exactly those containing the term are returned
+            stored = [prop_with_term, prop_without_term]
+            returned_ids = result_ids & {p['property_id'] for p in stored}
+            matching_ids = _ids_matching_search(stored, search_term)
+            assert returned_ids == matching_ids, \
+                f"Returned {returned_ids}, but properties {matching_ids} contain search term '{search_term}'"
 
 
 class TestMultipleFilterIntersection:
@@ -620,95 +608,64 @@ class TestMultipleFilterIntersection:
     
     @given(
         target_risk=risk_category(),
-        target_defect=defect_category(),
+        target_defect=real_defect_category(),
         search_term=st.text(
             alphabet=st.characters(whitelist_categories=('Lu', 'Ll', 'Nd')),
             min_size=2,
             max_size=8
         )
     )
-    @settings(max_examples=100)
-    def test_multiple_filter_intersection(self, target_risk, target_defect, search_term, snowflake_connection):
+    def test_multiple_filter_intersection(self, target_risk, target_defect, search_term, snowflake_connection, db_savepoint, cursor, ingestion, dashboard):
         """
         **Feature: ai-home-inspection, Property 20: Multiple filter intersection**
         **Validates: Requirements 7.4**
         
         Test that multiple filters work together (AND logic).
         """
-        assume(target_defect != 'none')  # Skip 'none' as it's not a real defect
-        
-        # Arrange
-        ingestion = DataIngestion(snowflake_connection)
-        classification = AIClassification(snowflake_connection)
-        dashboard = DashboardData(snowflake_connection)
-        
-        # Map risk categories to scores
-        risk_scores = {
-            'Low': 2,
-            'Medium': 7,
-            'High': 12
-        }
-        
-        # Create property that matches ALL filters
-        matching_prop = {
-            'property_id': str(uuid.uuid4().hex),
-            'location': f"Location with {search_term}",
-            'inspection_date': date(2020, 1, 1)
-        }
-        
-        # Create property that matches only risk (not defect or search)
-        risk_only_prop = {
-            'property_id': str(uuid.uuid4().hex),
-            'location': "Different location",
-            'inspection_date': date(2020, 1, 2)
-        }
-        
-        # Store matching property
-        matching_id = ingestion.ingest_property(matching_prop)
-        matching_room_id = str(uuid.uuid4().hex)
-        ingestion.ingest_room({
-            'room_id': matching_room_id,
-            'room_type': 'kitchen',
-            'room_location': None
-        }, matching_id)
-        matching_finding_id = ingestion.ingest_text_finding(f"Finding with {target_defect}", matching_room_id)
-        
-        # Add defect tag
-        import uuid as uuid_module
-        tag_id = str(uuid_module.uuid4())
-        cursor = snowflake_connection.cursor()
-        try:
+        with db_savepoint():
+            # Arrange - Create property that matches ALL filters
+            matching_prop = {
+                'property_id': TEST_ID_PREFIX + uuid.uuid4().hex,
+                'location': f"Location with {search_term}",
+                'inspection_date': date(2020, 1, 1)
+            }
+            
+            # Create property that matches only risk (not defect or search)
+            risk_only_prop = {
+                'property_id': TEST_ID_PREFIX + uuid.uuid4().hex,
+                'location': "Different location",
+                'inspection_date': date(2020, 1, 2)
+            }
+            
+            # Store both properties
+            matching_id, risk_only_id = ingestion.ingest_properties_bulk([matching_prop, risk_only_prop])
+            matching_room_id = str(uuid.uuid4().hex)
+            ingestion.ingest_room({
+                'room_id': matching_room_id,
+                'room_type': 'kitchen',
+                'room_location': None
+            }, matching_id)
+            matching_finding_id = ingestion.ingest_text_finding(f"Finding with {target_defect}", matching_room_id)
+            
+            # Add the defect tag and set both risk scores under a single commit
+            tag_id = str(uuid.uuid4())
             cursor.execute("""
                 INSERT INTO defect_tags (tag_id, finding_id, defect_category, 
                                        confidence_score, severity_weight)
                 VALUES (%s, %s, %s, %s, %s)
             """, (tag_id, matching_finding_id, target_defect, 0.9,
-                  classification.SEVERITY_WEIGHTS.get(target_defect, 0)))
+                  AIClassification.SEVERITY_WEIGHTS.get(target_defect, 0)))
             
-            # Set risk score and category
-            cursor.execute("""
-                UPDATE properties
-                SET risk_score = %s, risk_category = %s
-                WHERE property_id = %s
-            """, (risk_scores[target_risk], target_risk, matching_id))
-            snowflake_connection.commit()
-        finally:
-            cursor.close()
-        
-        # Store risk-only property
-        risk_only_id = ingestion.ingest_property(risk_only_prop)
-        cursor = snowflake_connection.cursor()
-        try:
-            cursor.execute("""
+            cursor.executemany("""
                 UPDATE properties
                 SET risk_score = %s, risk_category = %s
                 WHERE property_id = %s
-            """, (risk_scores[target_risk], target_risk, risk_only_id))
+            """, [
+                (RISK_SCORES[target_risk], target_risk, prop_id)
+                for prop_id in (matching_id, risk_only_id)
+            ])
             snowflake_connection.commit()
-        finally:
-            cursor.close()
-        
-        try:
+            
             # Act - Apply all three filters
             result = dashboard.get_property_list(
                 risk_level=target_risk,
@@ -725,33 +682,31 @@ class TestMultipleFilterIntersection:
             assert risk_only_id not in result_ids, \
                 "Property matching only risk filter should not be in results"
             
-            # Assert - All results satisfy all filters
+            # Assert - Returned rows for the stored properties satisfy the risk and
+            # search filters as the dashboard reports them
+            term = search_term.lower()
             for prop in result:
                 if prop['property_id'] in {matching_id, risk_only_id}:
-                    # Check risk filter
                     assert prop['risk_category'] == target_risk, \
                         f"Property should have risk category {target_risk}"
-                    
-                    # Check search filter
-                    location_match = search_term.lower() in (prop['location'] or '').lower()
-                    id_match = search_term.lower() in (prop['property_id'] or '').lower()
-                    summary_match = search_term.lower() in (prop['summary_text'] or '').lower()
-                    assert location_match or id_match or summary_match, \
-                        f"Property should contain search term '{search_term}'"
-        
-        finally:
-            # Clean up
-            cursor = snowflake_connection.cursor()
-            try:
-                cursor.execute("DELETE FROM defect_tags WHERE finding_id = %s", (matching_finding_id,))
-                cursor.execute("DELETE FROM findings WHERE finding_id = %s", (matching_finding_id,))
-                cursor.execute("DELETE FROM rooms WHERE room_id = %s", (matching_room_id,))
-                cursor.execute("DELETE FROM properties WHERE property_id IN (%s, %s)", 
-                             (matching_id, risk_only_id))
-                snowflake_connection.commit()
-            finally:
-                cursor.close()
-
+                    assert any(
+                        term in (prop[column] or '').lower()
+                        for column in ('location', 'property_id', 'summary_text')
+                    ), f"Property should contain search term '{search_term}'"
+
+
+# Fixed inputs always tried by the filter-clearing test: risk categories are
+# assigned in RISK_CATEGORIES order, so the first two seeds are Low and Medium
+# (a 'High' filter matches nothing, 'Low' matches one) and all five mix every
+# category
+FILTER_CLEARING_SEEDS = [
+    {
+        'property_id': f"{TEST_ID_PREFIX}seed_{i}",
+        'location': f"Seed location {i}",
+        'inspection_date': date(2021, 1, 1) + timedelta(days=i)
+    }
+    for i in range(5)
+]
 
 
 class TestFilterClearing:
@@ -762,87 +717,74 @@ class TestFilterClearing:
     result in displaying the same set of properties as the initial unfiltered state.
     """
     
+    @pytest.mark.slow
     @given(
         properties=st.lists(property_data(), min_size=2, max_size=5, unique_by=lambda p: p['property_id']),
         filter_risk=risk_category()
     )
-    @settings(max_examples=100)
-    def test_filter_clearing_restores_full_list(self, properties, filter_risk, snowflake_connection):
+    @example(properties=FILTER_CLEARING_SEEDS[:2], filter_risk='High')
+    @example(properties=FILTER_CLEARING_SEEDS[:2], filter_risk='Low')
+    @example(properties=FILTER_CLEARING_SEEDS, filter_risk='Medium')
+    def test_filter_clearing_restores_full_list(self, properties, filter_risk, snowflake_connection, db_savepoint, cursor, dashboard):
         """
         **Feature: ai-home-inspection, Property 21: Filter clearing restores full list**
         **Validates: Requirements 7.5**
         
         Test that clearing filters returns the full property list.
         """
-        # Arrange
-        ingestion = DataIngestion(snowflake_connection)
-        risk_scoring = RiskScoring(snowflake_connection)
-        dashboard = DashboardData(snowflake_connection)
-        
-        # Map risk categories to scores
-        risk_scores = {
-            'Low': 2,
-            'Medium': 7,
-            'High': 12
-        }
-        
-        # Store all properties with various risk levels
-        stored_ids = []
-        risk_categories = ['Low', 'Medium', 'High']
-        for i, prop_data in enumerate(properties):
-            prop_id = ingestion.ingest_property(prop_data)
-            stored_ids.append(prop_id)
-            
-            # Assign risk category (cycle through them)
-            risk_cat = risk_categories[i % len(risk_categories)]
-            cursor = snowflake_connection.cursor()
-            try:
-                cursor.execute("""
-                    UPDATE properties
-                    SET risk_score = %s, risk_category = %s
-                    WHERE property_id = %s
-                """, (risk_scores[risk_cat], risk_cat, prop_id))
-                snowflake_connection.commit()
-            finally:
-                cursor.close()
-        
-        try:
+        with db_savepoint():
+            # Arrange - The seed examples reuse fixed ids and Snowflake does not
+            # enforce primary keys, so drop rows left by an earlier run first
+            property_ids = [prop['property_id'] for prop in properties]
+            cursor.execute(
+                f"DELETE FROM properties WHERE property_id IN ({', '.join(['%s'] * len(property_ids))})",
+                tuple(property_ids)
+            )
+            
+            # Store all properties with their risk category (cycle through them)
+            # in a single INSERT instead of an insert followed by an update
+            assigned = list(zip(itertools.cycle(RISK_CATEGORIES), properties))
+            cursor.executemany("""
+                INSERT INTO properties (property_id, location, inspection_date,
+                                        risk_score, risk_category)
+                VALUES (%s, %s, %s, %s, %s)
+            """, [
+                (prop['property_id'], prop['location'], prop['inspection_date'],
+                 RISK_SCORES[risk_cat], risk_cat)
+                for risk_cat, prop in assigned
+            ])
+            snowflake_connection.commit()
+            
             # Act - Get initial unfiltered list
             initial_result = dashboard.get_property_list()
-            initial_ids = {p['property_id'] for p in initial_result}
+            initial_ids = frozenset(p['property_id'] for p in initial_result)
             
             # Act - Apply a filter
             filtered_result = dashboard.get_property_list(risk_level=filter_risk)
-            filtered_ids = {p['property_id'] for p in filtered_result}
-            
-            # Verify filter actually filtered something (if possible)
-            # (It's ok if all properties happen to have the same risk level)
+            filtered_ids = frozenset(p['property_id'] for p in filtered_result)
             
             # Act - Clear filters (call with no parameters)
             cleared_result = dashboard.get_property_list()
-            cleared_ids = {p['property_id'] for p in cleared_result}
+            cleared_ids = frozenset(p['property_id'] for p in cleared_result)
+            
+            # Assert - Of the stored properties, the filter kept exactly those
+            # assigned filter_risk
+            expected_ids = frozenset(p['property_id'] for p in properties)
+            expected_filtered = frozenset(
+                prop['property_id'] for risk_cat, prop in assigned if risk_cat == filter_risk
+            )
+            assert filtered_ids & expected_ids == expected_filtered, \
+                f"A {filter_risk} filter should keep exactly the stored {filter_risk} properties"
             
             # Assert - Cleared list should match initial list
-            expected_ids = {p['property_id'] for p in properties}
-            assert expected_ids.issubset(initial_ids), \
+            assert expected_ids <= initial_ids, \
                 "Initial unfiltered list should contain all stored properties"
-            assert expected_ids.issubset(cleared_ids), \
+            assert expected_ids <= cleared_ids, \
                 "Cleared list should contain all stored properties"
             
             # Assert - Initial and cleared lists should be the same
             assert initial_ids == cleared_ids, \
                 "Clearing filters should restore the same set as initial unfiltered state"
-        
-        finally:
-            # Clean up
-            cursor = snowflake_connection.cursor()
-            try:
-                for prop_id in stored_ids:
-                    cursor.execute("DELETE FROM properties WHERE property_id = %s", (prop_id,))
-                snowflake_connection.commit()
-            finally:
-                cursor.close()
-
 
 
 class TestFilteringEdgeCases:
@@ -850,35 +792,27 @@ class TestFilteringEdgeCases:
     Unit tests for filtering edge cases
     """
     
-    def test_filtering_with_no_matching_results(self, snowflake_connection):
+    def test_filtering_with_no_matching_results(self, snowflake_connection, db_savepoint, cursor, ingestion, dashboard):
         """
         Test filtering with no matching results returns empty list
         Requirements: 7.1, 7.2, 7.3
         """
-        # Arrange
-        ingestion = DataIngestion(snowflake_connection)
-        dashboard = DashboardData(snowflake_connection)
-        
-        # Create a property with Low risk
-        prop_data = {
-            'property_id': str(uuid.uuid4().hex),
-            'location': 'Test Location',
-            'inspection_date': date(2020, 1, 1)
-        }
-        prop_id = ingestion.ingest_property(prop_data)
-        
-        cursor = snowflake_connection.cursor()
-        try:
+        with db_savepoint():
+            # Arrange - Create a property with Low risk
+            prop_data = {
+                'property_id': TEST_ID_PREFIX + uuid.uuid4().hex,
+                'location': 'Test Location',
+                'inspection_date': date(2020, 1, 1)
+            }
+            prop_id = ingestion.ingest_property(prop_data)
+            
             cursor.execute("""
                 UPDATE properties
                 SET risk_score = 2, risk_category = 'Low'
                 WHERE property_id = %s
             """, (prop_id,))
             snowflake_connection.commit()
-        finally:
-            cursor.close()
-        
-        try:
+            
             # Act - Filter for High risk (should return empty)
             result = dashboard.get_property_list(risk_level='High')
             
@@ -886,41 +820,28 @@ class TestFilteringEdgeCases:
             assert isinstance(result, list), "Should return a list"
             assert prop_id not in {p['property_id'] for p in result}, \
                 "Property with Low risk should not be in High risk filter results"
-        
-        finally:
-            # Clean up
-            cursor = snowflake_connection.cursor()
-            try:
-                cursor.execute("DELETE FROM properties WHERE property_id = %s", (prop_id,))
-                snowflake_connection.commit()
-            finally:
-                cursor.close()
-    
-    def test_search_with_partial_matches(self, snowflake_connection):
+    
+    def test_search_with_partial_matches(self, db_savepoint, ingestion, dashboard):
         """
         Test search with partial matches works correctly
         Requirements: 7.3
         """
-        # Arrange
-        ingestion = DataIngestion(snowflake_connection)
-        dashboard = DashboardData(snowflake_connection)
-        
-        # Create properties with partial match scenarios
-        prop1_data = {
-            'property_id': str(uuid.uuid4().hex),
-            'location': 'Building ABC',
-            'inspection_date': date(2020, 1, 1)
-        }
-        prop2_data = {
-            'property_id': str(uuid.uuid4().hex),
-            'location': 'Building XYZ',
-            'inspection_date': date(2020, 1, 2)
-        }
-        
-        prop1_id = ingestion.ingest_property(prop1_data)
-        prop2_id = ingestion.ingest_property(prop2_data)
-        
-        try:
+        with db_savepoint():
+            # Arrange - Create properties with partial match scenarios
+            prop1_data = {
+                'property_id': TEST_ID_PREFIX + uuid.uuid4().hex,
+                'location': 'Building ABC',
+                'inspection_date': date(2020, 1, 1)
+            }
+            prop2_data = {
+                'property_id': TEST_ID_PREFIX + uuid.uuid4().hex,
+                'location': 'Building XYZ',
+                'inspection_date': date(2020, 1, 2)
+            }
+            
+            prop1_id = ingestion.ingest_property(prop1_data)
+            prop2_id = ingestion.ingest_property(prop2_data)
+            
             # Act - Search for partial term "ABC"
             result = dashboard.get_property_list(search_term='ABC')
             result_ids = {p['property_id'] for p in result}
@@ -943,36 +864,44 @@ class TestFilteringEdgeCases:
             
             # Assert - Should find property (case-insensitive)
             assert prop1_id in result3_ids, "Search should be case-insensitive"
-        
-        finally:
-            # Clean up
-            cursor = snowflake_connection.cursor()
-            try:
-                cursor.execute("DELETE FROM properties WHERE property_id IN (%s, %s)", 
-                             (prop1_id, prop2_id))
-                snowflake_connection.commit()
-            finally:
-                cursor.close()
-    
-    def test_empty_database_returns_empty_list(self, snowflake_connection):
+    
+    def test_property_ids_filter_limits_results(self, db_savepoint, ingestion, dashboard):
+        """
+        Test that property_ids restricts the list to exactly those properties
+        Requirements: 7.1
+        """
+        with db_savepoint():
+            # Arrange
+            stored_ids = ingestion.ingest_properties_bulk([
+                {
+                    'property_id': TEST_ID_PREFIX + uuid.uuid4().hex,
+                    'location': location,
+                    'inspection_date': date(2020, 1, 1)
+                }
+                for location in ('Kept Location', 'Other Location')
+            ])
+            
+            # Act
+            result = dashboard.get_property_list(property_ids=stored_ids[:1])
+            
+            # Assert - Only the requested property is returned
+            assert [p['property_id'] for p in result] == stored_ids[:1], \
+                "Only the requested property should be returned"
+            assert dashboard.get_property_list(property_ids=[]) == [], \
+                "An empty id list should match nothing"
+            assert dashboard.get_property_list_columnar(property_ids=[]) == {
+                column: [] for column in DashboardData.PROPERTY_LIST_COLUMNS
+            }, "An empty id list should give empty columns"
+    
+    def test_empty_database_returns_empty_list(self, dashboard):
         """
         Test that querying an empty database returns empty list, not error
         Requirements: 7.1
         """
-        # Arrange
-        dashboard = DashboardData(snowflake_connection)
-        
-        # Clear any existing properties (from other tests)
-        cursor = snowflake_connection.cursor()
-        try:
-            # Get all property IDs
-            cursor.execute("SELECT property_id FROM properties")
-            # Note: This won't work with the mock, but that's ok for this test
-        finally:
-            cursor.close()
-        
-        # Act - Get property list (may have properties from other tests, that's ok)
-        result = dashboard.get_property_list()
+        # Act - Query a property that does not exist, so the database returns no
+        # rows whatever other tests have stored, without shipping the table back
+        result = dashboard.get_property_list(property_ids=[TEST_ID_PREFIX + uuid.uuid4().hex])
         
-        # Assert - Should return a list (not None or error)
+        # Assert - Should return an empty list (not None or error)
         assert isinstance(result, list), "Should return a list even if empty"
+        assert result == [], "An empty query result should give an empty list"
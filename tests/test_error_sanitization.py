@@ -3,9 +3,12 @@ Property-based tests for error message sanitization
 Validates: Requirements 9.5
 """
 
+import os
+import re
+
 import pytest
-from hypothesis import given, strategies as st, settings
-from src.dashboard_app import sanitize_error_message
+from hypothesis import given, example, assume, strategies as st, settings, Phase
+from src.error_sanitizer import sanitize_error_message
 
 
 # Define sensitive patterns that should be hidden
@@ -16,6 +19,15 @@ SENSITIVE_PATTERNS = [
     'snowflake.snowflakecomputing.com'
 ]
 
+# Finds any sensitive pattern in one scan, whatever its case
+SENSITIVE_RE = re.compile('|'.join(map(re.escape, SENSITIVE_PATTERNS)), re.IGNORECASE)
+
+# Generic errors must avoid all of these, in any case
+GENERIC_EXCLUDED_RE = re.compile(
+    '|'.join(map(re.escape, SENSITIVE_PATTERNS + ['database', 'connection', 'query', 'sql'])),
+    re.IGNORECASE
+)
+
 
 @st.composite
 def error_with_sensitive_data(draw):
@@ -63,18 +75,35 @@ def generic_error(draw):
     )
     error_message = draw(st.text(alphabet=safe_chars, min_size=1, max_size=100))
     
-    # Make sure it doesn't accidentally contain sensitive patterns
-    for pattern in SENSITIVE_PATTERNS + ['database', 'connection', 'query', 'sql']:
-        if pattern.lower() in error_message.lower():
-            # Skip this example if it contains sensitive data
-            return Exception("Safe error message")
+    # Reject text that accidentally contains sensitive patterns
+    assume(not GENERIC_EXCLUDED_RE.search(error_message))
     
     return Exception(error_message)
 
 
+# Shared strategy instances for the @given decorators below
+ERROR_WITH_SENSITIVE_DATA = error_with_sensitive_data()
+DATABASE_ERROR = database_error()
+GENERIC_ERROR = generic_error()
+
+# Sanitization is driven by a fixed pattern list, so the curated examples below
+# cover it; set FAST_SANITIZE=1 to run only those and skip random generation
+SANITIZE_PHASES = (Phase.explicit,) if os.getenv("FAST_SANITIZE") else settings.default.phases
+
+
+def with_examples(*errors):
+    """Attach each error as an explicit Hypothesis example"""
+    def decorate(test):
+        for error in errors:
+            test = example(error=error)(test)
+        return test
+    return decorate
+
+
 # **Feature: ai-home-inspection, Property 27: Error messages hide sensitive details**
-@given(error=error_with_sensitive_data())
-@settings(max_examples=100)
+@with_examples(*(Exception(f"Request failed: {pattern}xyz") for pattern in SENSITIVE_PATTERNS))
+@given(error=ERROR_WITH_SENSITIVE_DATA)
+@settings(max_examples=100, phases=SANITIZE_PHASES)
 def test_property_27_sensitive_data_is_hidden(error):
     """
     Property 27: Error messages hide sensitive details
@@ -88,17 +117,16 @@ def test_property_27_sensitive_data_is_hidden(error):
     sanitized = sanitize_error_message(error)
     
     # Check that sanitized message doesn't contain any sensitive patterns
-    sanitized_lower = sanitized.lower()
-    
-    for pattern in SENSITIVE_PATTERNS:
-        assert pattern not in sanitized_lower, (
-            f"Sanitized message contains sensitive pattern '{pattern}': {sanitized}"
-        )
+    match = SENSITIVE_RE.search(sanitized)
+    assert match is None, (
+        f"Sanitized message contains sensitive pattern '{match.group(0)}': {sanitized}"
+    )
 
 
 # **Feature: ai-home-inspection, Property 27: Error messages hide sensitive details**
-@given(error=database_error())
-@settings(max_examples=100)
+@with_examples(*(Exception(f"Failed {keyword} call") for keyword in ['database', 'connection', 'query', 'sql', 'SQL']))
+@given(error=DATABASE_ERROR)
+@settings(max_examples=100, phases=SANITIZE_PHASES)
 def test_property_27_database_errors_are_generic(error):
     """
     Property 27: Error messages hide sensitive details (database errors)
@@ -117,8 +145,9 @@ def test_property_27_database_errors_are_generic(error):
 
 
 # **Feature: ai-home-inspection, Property 27: Error messages hide sensitive details**
-@given(error=generic_error())
-@settings(max_examples=100)
+@with_examples(Exception("Invalid input format"), Exception("Value out of range!"), Exception("x"))
+@given(error=GENERIC_ERROR)
+@settings(max_examples=100, phases=SANITIZE_PHASES)
 def test_property_27_sanitization_always_returns_safe_message(error):
     """
     Property 27: Error messages hide sensitive details (always safe)
@@ -137,11 +166,10 @@ def test_property_27_sanitization_always_returns_safe_message(error):
     assert len(sanitized) > 0, "Sanitized message should not be empty"
     
     # Should not contain any sensitive patterns
-    sanitized_lower = sanitized.lower()
-    for pattern in SENSITIVE_PATTERNS:
-        assert pattern not in sanitized_lower, (
-            f"Sanitized message contains sensitive pattern '{pattern}': {sanitized}"
-        )
+    match = SENSITIVE_RE.search(sanitized)
+    assert match is None, (
+        f"Sanitized message contains sensitive pattern '{match.group(0)}': {sanitized}"
+    )
 
 
 # Unit tests for specific edge cases
@@ -6,14 +6,9 @@ Feature: ai-home-inspection
 import pytest
 from hypothesis import given, strategies as st, settings
 from datetime import date, timedelta
-import sys
-import os
 import csv
 import io
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
 from export import ExportComponent
 from data_ingestion import DataIngestion
 from ai_classification import AIClassification
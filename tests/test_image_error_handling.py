@@ -4,14 +4,9 @@ Feature: ai-home-inspection
 """
 
 import pytest
-import sys
-import os
 import uuid
 from datetime import date
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
 from data_ingestion import DataIngestion
 from ai_classification import AIClassification
 
@@ -5,11 +5,6 @@ Tests dashboard functionality without requiring live Snowflake connection
 
 import pytest
 from unittest.mock import Mock, MagicMock
-import sys
-import os
-
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from src.dashboard_data import DashboardData
 
@@ -6,13 +6,8 @@ Feature: ai-home-inspection
 import pytest
 from hypothesis import given, strategies as st, settings
 from datetime import date, timedelta
-import sys
-import os
 import uuid
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
 from data_ingestion import DataIngestion
 from ai_classification import AIClassification
 